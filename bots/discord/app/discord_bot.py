@@ -27,7 +27,7 @@ from assets import static_storage
 from helpers.utils import Utils
 from helpers import constants
 
-from TickerParser import TickerParser
+from TickerParser import AsyncTickerParser
 from Processor import Processor
 from DatabaseConnector import DatabaseConnector
 from engine.assistant import Assistant
@@ -1372,7 +1372,7 @@ class Alpha(discord.AutoShardedClient):
 		try:
 			arguments = requestSlice.split(" ")
 
-			outputMessage, request = Processor.process_chart_arguments(messageRequest, arguments[1:], tickerId=arguments[0].upper())
+			outputMessage, request = await Processor.process_chart_arguments(messageRequest, arguments[1:], tickerId=arguments[0].upper())
 			if outputMessage is not None:
 				if not messageRequest.is_muted() and outputMessage != "":
 					embed = discord.Embed(title=outputMessage, description="Detailed guide with examples is available on [our website](https://www.alphabotsystem.com/guide/charts).", color=constants.colors["gray"])
@@ -1415,7 +1415,7 @@ class Alpha(discord.AutoShardedClient):
 			arguments = requestSlice.split(" ")
 
 			if messageRequest.flow_available():
-				outputMessage, request = Processor.process_chart_arguments(messageRequest, arguments[1:], tickerId=arguments[0].upper(), platformQueue=["Alpha Flow"])
+				outputMessage, request = await Processor.process_chart_arguments(messageRequest, arguments[1:], tickerId=arguments[0].upper(), platformQueue=["Alpha Flow"])
 				if outputMessage is not None:
 					if not messageRequest.is_muted() and messageRequest.is_registered() and outputMessage != "":
 						embed = discord.Embed(title=outputMessage, description="Detailed guide with examples is available on [our website](https://www.alphabotsystem.com/guide/flow).", color=constants.colors["gray"])
@@ -1472,7 +1472,7 @@ class Alpha(discord.AutoShardedClient):
 		try:
 			arguments = requestSlice.split(" ")
 
-			outputMessage, request = Processor.process_heatmap_arguments(messageRequest, arguments)
+			outputMessage, request = await Processor.process_heatmap_arguments(messageRequest, arguments)
 			if outputMessage is not None:
 				if not messageRequest.is_muted() and outputMessage != "":
 					embed = discord.Embed(title=outputMessage, description="Detailed guide with examples is available on [our website](https://www.alphabotsystem.com/guide/heat-maps).", color=constants.colors["gray"])
@@ -1514,7 +1514,7 @@ class Alpha(discord.AutoShardedClient):
 		try:
 			arguments = requestSlice.split(" ")
 
-			outputMessage, request = Processor.process_quote_arguments(messageRequest, arguments[1:], tickerId=arguments[0].upper(), excluded=["CoinGecko", "Quandl", "LLD"])
+			outputMessage, request = await Processor.process_quote_arguments(messageRequest, arguments[1:], tickerId=arguments[0].upper(), excluded=["CoinGecko", "Quandl", "LLD"])
 			if outputMessage is not None:
 				if not messageRequest.is_muted() and outputMessage != "":
 					embed = discord.Embed(title=outputMessage, description="Detailed guide with examples is available on [our website](https://www.alphabotsystem.com/guide/orderbook-visualizations).", color=constants.colors["gray"])
@@ -1561,7 +1561,7 @@ class Alpha(discord.AutoShardedClient):
 
 			if method in ["set", "create", "add"] and len(arguments) >= 2:
 				if messageRequest.price_alerts_available():
-					outputMessage, request = Processor.process_quote_arguments(messageRequest, arguments[2:], tickerId=arguments[1].upper(), isMarketAlert=True, excluded=["CoinGecko", "Quandl", "LLD"])
+					outputMessage, request = await Processor.process_quote_arguments(messageRequest, arguments[2:], tickerId=arguments[1].upper(), isMarketAlert=True, excluded=["CoinGecko", "Quandl", "LLD"])
 					if outputMessage is not None:
 						if not messageRequest.is_muted() and messageRequest.is_registered() and outputMessage != "":
 							embed = discord.Embed(title=outputMessage, description="Detailed guide with examples is available on [our website](https://www.alphabotsystem.com/guide/price-alerts).", color=constants.colors["gray"])
@@ -1588,9 +1588,9 @@ class Alpha(discord.AutoShardedClient):
 
 					level = request.get_numerical_parameters()[0]
 					if request.currentPlatform == "CCXT":
-						levelText = TickerParser.get_formatted_price(exchange.id, ticker.symbol, level)
+						levelText = await AsyncTickerParser.get_formatted_price(exchange.id, ticker.symbol, level)
 					elif request.currentPlatform == "CoinGecko":
-						levelText = ("{:,.%df}" % (4 if TickerParser.check_if_fiat(ticker.quote)[0] and not ticker.isReversed else 8)).format(level)
+						levelText = ("{:,.%df}" % (4 if (await AsyncTickerParser.check_if_fiat(ticker.quote))[0] and not ticker.isReversed else 8)).format(level)
 					elif request.currentPlatform == "IEXC" or request.currentPlatform == "Quandl":
 						levelText = "{:,.5f}".format(level)
 					else:
@@ -1713,7 +1713,7 @@ class Alpha(discord.AutoShardedClient):
 		try:
 			arguments = requestSlice.split(" ")
 
-			outputMessage, request = Processor.process_quote_arguments(messageRequest, arguments[1:], tickerId=arguments[0].upper())
+			outputMessage, request = await Processor.process_quote_arguments(messageRequest, arguments[1:], tickerId=arguments[0].upper())
 			if outputMessage is not None:
 				if not messageRequest.is_muted() and outputMessage != "":
 					embed = discord.Embed(title=outputMessage, description="Detailed guide with examples is available on [our website](https://www.alphabotsystem.com/guide/prices).", color=constants.colors["gray"])
@@ -1765,7 +1765,7 @@ class Alpha(discord.AutoShardedClient):
 		try:
 			arguments = requestSlice.split(" ")
 
-			outputMessage, request = Processor.process_quote_arguments(messageRequest, arguments[1:], tickerId=arguments[0].upper())
+			outputMessage, request = await Processor.process_quote_arguments(messageRequest, arguments[1:], tickerId=arguments[0].upper())
 			if outputMessage is not None:
 				if not messageRequest.is_muted() and outputMessage != "":
 					embed = discord.Embed(title=outputMessage, description="Detailed guide with examples is available on [our website](https://www.alphabotsystem.com/guide/volume).", color=constants.colors["gray"])
@@ -1846,7 +1846,7 @@ class Alpha(discord.AutoShardedClient):
 		try:
 			arguments = requestSlice.split(" ")
 
-			outputMessage, request = Processor.process_detail_arguments(messageRequest, arguments[1:], tickerId=arguments[0].upper())
+			outputMessage, request = await Processor.process_detail_arguments(messageRequest, arguments[1:], tickerId=arguments[0].upper())
 			if outputMessage is not None:
 				if not messageRequest.is_muted() and outputMessage != "":
 					embed = discord.Embed(title=outputMessage, description="Detailed guide with examples is available on [our website](https://www.alphabotsystem.com/guide/asset-details).", color=constants.colors["gray"])
@@ -2019,7 +2019,7 @@ class Alpha(discord.AutoShardedClient):
 		try:
 			arguments = requestSlice.split(" ")
 
-			outputMessage, request = Processor.process_quote_arguments(messageRequest, arguments[1:], tickerId=arguments[0].upper(), platformQueue=["CCXT"])
+			outputMessage, request = await Processor.process_quote_arguments(messageRequest, arguments[1:], tickerId=arguments[0].upper(), platformQueue=["CCXT"])
 			if outputMessage is not None:
 				if not messageRequest.is_muted() and outputMessage != "":
 					embed = discord.Embed(title=outputMessage, description="Detailed guide with examples is available on [our website](https://www.alphabotsystem.com/guide/asset-details).", color=constants.colors["gray"])
@@ -2029,7 +2029,7 @@ class Alpha(discord.AutoShardedClient):
 
 			await message.channel.trigger_typing()
 
-			listings, total = TickerParser.get_listings(request.get_ticker())
+			listings, total = await AsyncTickerParser.get_listings(request.get_ticker())
 			if total != 0:
 				embed = discord.Embed(color=constants.colors["deep purple"])
 				embed.set_author(name="{} listings".format(request.get_ticker().base))
@@ -2085,7 +2085,7 @@ class Alpha(discord.AutoShardedClient):
 
 			if method in ["ichibot", "ichi"]:
 				if messageRequest.is_registered():
-					outputMessage, request = Processor.process_trade_arguments(messageRequest, arguments[1:], platformQueue=["Ichibot"])
+					outputMessage, request = await Processor.process_trade_arguments(messageRequest, arguments[1:], platformQueue=["Ichibot"])
 					if outputMessage is not None:
 						if not messageRequest.is_muted() and outputMessage != "":
 							embed = discord.Embed(title=outputMessage, description="Detailed guide with examples is available on [our website](https://www.alphabotsystem.com/guide/ichibot).", color=constants.colors["gray"])
@@ -2297,9 +2297,9 @@ class Alpha(discord.AutoShardedClient):
 					for asset, holding in balances.items():
 						if holding == 0: continue
 						if platform == "CCXT":
-							ticker, _ = TickerParser.find_coingecko_crypto_market(Ticker(asset))
+							ticker, _ = await AsyncTickerParser.find_coingecko_crypto_market(Ticker(asset))
 						else:
-							ticker, _ = TickerParser.find_iexc_market(Ticker(asset), None)
+							ticker, _ = await AsyncTickerParser.find_iexc_market(Ticker(asset), None)
 
 						balanceText = ""
 						valueText = "No conversion"
@@ -2418,7 +2418,7 @@ class Alpha(discord.AutoShardedClient):
 			orderType = arguments[0]
 
 			if orderType in ["buy", "sell", "stop-sell"] and 2 <= len(arguments) <= 8:
-				outputMessage, request = Processor.process_quote_arguments(messageRequest, arguments[2:], tickerId=arguments[1].upper(), isPaperTrade=True, excluded=["CoinGecko", "Quandl", "LLD"])
+				outputMessage, request = await Processor.process_quote_arguments(messageRequest, arguments[2:], tickerId=arguments[1].upper(), isPaperTrade=True, excluded=["CoinGecko", "Quandl", "LLD"])
 				if outputMessage is not None:
 					if not messageRequest.is_muted() and messageRequest.is_registered() and outputMessage != "":
 						embed = discord.Embed(title=outputMessage, description="Detailed guide with examples is available on [our website](https://www.alphabotsystem.com/guide/paper-trader).", color=constants.colors["gray"])
@@ -2445,7 +2445,7 @@ class Alpha(discord.AutoShardedClient):
 					try: await tradeMessage.add_reaction("☑")
 					except: pass
 				else:
-					outputTitle, outputMessage, paper, pendingOrder = self.paperTrader.process_trade(messageRequest.accountProperties["paperTrader"], orderType, request, payload)
+					outputTitle, outputMessage, paper, pendingOrder = await self.paperTrader.process_trade(messageRequest.accountProperties["paperTrader"], orderType, request, payload)
 					if pendingOrder is None:
 						embed = discord.Embed(title=outputMessage, color=constants.colors["gray"])
 						embed.set_author(name=outputTitle, icon_url=static_storage.icon_bw)
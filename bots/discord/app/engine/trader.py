@@ -8,7 +8,7 @@ import zmq.asyncio
 import zlib
 import pickle
 
-from TickerParser import TickerParser
+from TickerParser import AsyncTickerParser
 from helpers.utils import Utils
 
 
@@ -34,7 +34,7 @@ class PaperTrader(object):
 		raw = raw.replace("@", " @ ").replace("%", " % ").replace(",", ".")
 		return " ".join(raw.split())
 
-	def process_trade(self, paper, orderType, request, payload):
+	async def process_trade(self, paper, orderType, request, payload):
 		outputTitle = None
 		outputMessage = None
 
@@ -77,9 +77,9 @@ class PaperTrader(object):
 			execAmount = (baseBalance * (execAmount / 100)) if isAmountPercent else execAmount
 
 		if request.currentPlatform == "CCXT":
-			execPriceText = TickerParser.get_formatted_price(exchange.id, ticker.symbol, execPrice)
+			execPriceText = await AsyncTickerParser.get_formatted_price(exchange.id, ticker.symbol, execPrice)
 			execPrice = float(execPriceText.replace(",", ""))
-			execAmountText = TickerParser.get_formatted_amount(exchange.id, ticker.symbol, execAmount)
+			execAmountText = await AsyncTickerParser.get_formatted_amount(exchange.id, ticker.symbol, execAmount)
 		else:
 			execPriceText = "{:,.6f}".format(execPrice)
 			execAmountText = "{:,.6f}".format(execAmount)
@@ -148,7 +148,7 @@ class Alpha(discord.AutoShardedClient):
 				if refreshRate in timeframes:
 					await asyncio.sleep(self.timeOffset)
 
-					try: outputMessage, request = Processor.process_quote_arguments(client.user.id, [] if self.exchange is None else [self.exchange], tickerId=self.tickerId, platformQueue=[self.platform])
+					try: outputMessage, request = await Processor.process_quote_arguments(client.user.id, [] if self.exchange is None else [self.exchange], tickerId=self.tickerId, platformQueue=[self.platform])
 					except: continue
 					if outputMessage is not None:
 						print(outputMessage)
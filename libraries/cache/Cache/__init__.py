@@ -1 +1,2 @@
-from .core import *
\ No newline at end of file
+from .core import *
+from .shared import SharedCache, SharedCacheServer, LocalSharedCache
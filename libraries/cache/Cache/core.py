@@ -1,47 +1,212 @@
-from threading import Thread
-from time import time, sleep
+import pickle
+import asyncio
+from threading import Thread, Lock
+from collections import OrderedDict
+from time import time
 
 
 class Cache(object):
-	def __init__(self, ttl=None):
+	def __init__(self, ttl=None, maxEntries=10000, maxSize=None, staleTtl=0, shared=None, negativeTtl=None, maxNegativeEntries=1000):
 		self.ttl = ttl
-		self.__cache = {}
-		self.__times = {}
-		if ttl is not None:
-			Thread(target=self.__loop, daemon=True).start()
+		self.shared = shared
+		self.negative = None if negativeTtl is None else Cache(ttl=negativeTtl, maxEntries=maxNegativeEntries)
+		self.staleTtl = staleTtl
+		self.maxEntries = maxEntries
+		self.maxSize = maxSize
+		self.size = 0
+		self.__cache = OrderedDict()
+		self.__expiries = OrderedDict()
+		self.__sizes = {}
+		self.__lock = Lock()
+
+		self.__computing = {}
+		self.__asyncComputing = {}
+		self.__refreshing = set()
 
 	def get(self, value, default=None):
-		return self.__cache.get(value, default)
+		with self.__lock:
+			cached, isFresh = self.__lookup(value)
+		if isFresh: return cached
+		cached = self.__load(value)
+		return default if cached is None else cached
 
 	def set(self, key, value):
-		self.__cache[key] = value
-		self.__times[key] = time()
+		expiry = None if self.ttl is None else time() + self.ttl
+		self.__store(key, value, expiry)
+		if self.shared is not None: self.shared.set(key, value, expiry)
+		if self.negative is not None: self.negative.pop(key)
+
+	def get_negative(self, key, default=None):
+		entry = self.__lookup_negative(key)
+		return default if entry is None else entry[0]
+
+	def set_negative(self, key, value):
+		# Negative results are stored wrapped, so that a cached None can be told apart from a miss
+		if self.negative is not None: self.negative.set(key, (value,))
 
 	def has(self, key):
-		return key in self.__cache
+		with self.__lock:
+			isFresh = self.__lookup(key)[1]
+		return isFresh or self.__load(key) is not None
 
 	def pop(self, value, default=None):
-		self.__times.pop(value, default)
-		return self.__cache.pop(value, default)
+		with self.__lock:
+			_, isFresh = self.__lookup(value)
+			cached = self.__remove(value)
+			return cached if isFresh else default
 
 	def keys(self):
-		return self.__cache.keys()
+		return [key for key, _ in self.items()]
 
 	def values(self):
-		return self.__cache.values()
+		return [value for _, value in self.items()]
 
 	def items(self):
-		return self.__cache.items()
-
-	def __loop(self):
-		while True:
-			try:
-				sleep(1)
-				keysToRemove = []
-				for key, value in self.__times.items():
-					if value <= time() - self.ttl:
-						keysToRemove.append(key)
-				for key in keysToRemove:
-					self.pop(key)
-			except:
-				pass
\ No newline at end of file
+		with self.__lock:
+			self.__expire()
+			now = time()
+			return [(key, value) for key, value in self.__cache.items() if self.ttl is None or self.__expiries[key] > now]
+
+	def __len__(self):
+		return len(self.items())
+
+	def get_or_compute(self, key, compute, staleWhileRevalidate=False, isCacheable=None):
+		with self.__lock:
+			cached, isFresh = self.__lookup(key)
+		if isFresh: return cached
+		if cached is not None and staleWhileRevalidate:
+			self.__refresh(key, compute, isCacheable)
+			return cached
+
+		lock = self.__acquire(key)
+		try:
+			with self.__lock:
+				cached, isFresh = self.__lookup(key)
+			if isFresh: return cached
+			return self.__compute(key, compute, isCacheable)
+		finally:
+			self.__release(key, lock)
+
+	async def get_or_compute_async(self, key, compute, staleWhileRevalidate=False, isCacheable=None):
+		with self.__lock:
+			cached, isFresh = self.__lookup(key)
+		if isFresh: return cached
+		if key not in self.__asyncComputing:
+			task = self.__asyncComputing[key] = asyncio.ensure_future(self.__compute_async(key, compute, isCacheable))
+			task.add_done_callback(lambda task: task.cancelled() or task.exception())
+		if cached is not None and staleWhileRevalidate: return cached
+		return await asyncio.shield(self.__asyncComputing[key])
+
+	@staticmethod
+	def sizeof(value):
+		if isinstance(value, (bytes, bytearray, str)): return len(value)
+		try: return len(pickle.dumps(value, -1))
+		except: return 0
+
+	def __compute(self, key, compute, isCacheable):
+		value = self.__load(key)
+		if value is not None: return value
+		entry = self.__lookup_negative(key)
+		if entry is not None: return entry[0]
+		value = compute()
+		if (value is not None) if isCacheable is None else isCacheable(value): self.set(key, value)
+		else: self.set_negative(key, value)
+		return value
+
+	async def __compute_async(self, key, compute, isCacheable):
+		try:
+			# Shared tier lookups block for up to the cache server timeout, so they run off the event loop
+			if self.shared is not None:
+				value = await asyncio.get_event_loop().run_in_executor(None, self.__load, key)
+				if value is not None: return value
+			entry = self.__lookup_negative(key)
+			if entry is not None: return entry[0]
+			value = await compute()
+			if (value is not None) if isCacheable is None else isCacheable(value): self.set(key, value)
+			else: self.set_negative(key, value)
+			return value
+		finally:
+			self.__asyncComputing.pop(key, None)
+
+	def __refresh(self, key, compute, isCacheable):
+		with self.__lock:
+			if key in self.__refreshing: return
+			self.__refreshing.add(key)
+
+		def refresh():
+			lock = self.__acquire(key)
+			try: self.__compute(key, compute, isCacheable)
+			except: pass
+			finally:
+				self.__release(key, lock)
+				with self.__lock: self.__refreshing.discard(key)
+		Thread(target=refresh, daemon=True).start()
+
+	def __lookup_negative(self, key):
+		if self.negative is None: return None
+		return self.negative.get(key)
+
+	def __store(self, key, value, expiry):
+		with self.__lock:
+			self.__remove(key)
+			self.__expire()
+
+			self.__cache[key] = value
+			if self.ttl is not None: self.__expiries[key] = expiry
+			if self.maxSize is not None:
+				self.__sizes[key] = Cache.sizeof(value)
+				self.size += self.__sizes[key]
+			self.__evict()
+
+	def __load(self, key):
+		if self.shared is None: return None
+		entry = self.shared.get(key)
+		if entry is None: return None
+		value, expiry = entry
+		if self.ttl is None: expiry = None
+		elif expiry is None: expiry = time() + self.ttl
+		self.__store(key, value, expiry)
+		return value
+
+	def __acquire(self, key):
+		with self.__lock:
+			lock = self.__computing.setdefault(key, [Lock(), 0])
+			lock[1] += 1
+		lock[0].acquire()
+		return lock
+
+	def __release(self, key, lock):
+		lock[0].release()
+		with self.__lock:
+			lock[1] -= 1
+			if lock[1] == 0: self.__computing.pop(key, None)
+
+	def __lookup(self, key):
+		if key not in self.__cache: return None, False
+		self.__cache.move_to_end(key)
+		if self.ttl is None: return self.__cache[key], True
+
+		expiry = self.__expiries[key]
+		now = time()
+		if expiry + self.staleTtl <= now:
+			self.__remove(key)
+			return None, False
+		return self.__cache[key], expiry > now
+
+	def __remove(self, key):
+		self.__expiries.pop(key, None)
+		self.size -= self.__sizes.pop(key, 0)
+		return self.__cache.pop(key, None)
+
+	def __expire(self):
+		# Every entry shares the same ttl, so expiries are ordered by insertion and only the oldest ones need checking. Entries loaded from the shared tier may expire slightly out of order, those get dropped on lookup instead
+		if self.ttl is None: return
+		now = time()
+		while len(self.__expiries) != 0:
+			key, expiry = next(iter(self.__expiries.items()))
+			if expiry + self.staleTtl > now: break
+			self.__remove(key)
+
+	def __evict(self):
+		while len(self.__cache) != 0 and ((self.maxEntries is not None and len(self.__cache) > self.maxEntries) or (self.maxSize is not None and self.size > self.maxSize)):
+			self.__remove(next(iter(self.__cache)))
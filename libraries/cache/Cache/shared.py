@@ -0,0 +1,158 @@
+import os
+import sys
+import pickle
+import hmac
+import hashlib
+from threading import Lock, local
+from collections import OrderedDict
+from time import time
+
+import zmq
+
+
+class SharedStore(object):
+	def __init__(self, maxEntries=100000, maxSize=256 * 1024 * 1024):
+		self.maxEntries = maxEntries
+		self.maxSize = maxSize
+		self.size = 0
+		self.entries = OrderedDict()
+		self.lock = Lock()
+
+	def get(self, key):
+		with self.lock:
+			entry = self.entries.get(key)
+			if entry is None: return None
+			if entry[0] is not None and entry[0] <= time():
+				self.__remove(key)
+				return None
+			self.entries.move_to_end(key)
+			return entry
+
+	def set(self, key, expiry, payload):
+		with self.lock:
+			self.__remove(key)
+			self.entries[key] = (expiry, payload)
+			self.size += len(payload)
+			while len(self.entries) > self.maxEntries or self.size > self.maxSize:
+				self.__remove(next(iter(self.entries)))
+
+	def __remove(self, key):
+		entry = self.entries.pop(key, None)
+		if entry is not None: self.size -= len(entry[1])
+
+
+class LocalSharedCache(object):
+	def __init__(self, namespace, store=None):
+		self.namespace = namespace
+		self.store = SharedStore() if store is None else store
+
+	def get(self, key):
+		entry = self.store.get("{}:{}".format(self.namespace, key))
+		if entry is None: return None
+		return pickle.loads(entry[1]), entry[0]
+
+	def set(self, key, value, expiry):
+		self.store.set("{}:{}".format(self.namespace, key), expiry, pickle.dumps(value, -1))
+
+
+class SharedCache(object):
+	zmqContext = zmq.Context.instance()
+
+	def __init__(self, namespace, address, secret, timeout=50, retryInterval=30):
+		self.namespace = namespace
+		self.address = address
+		self.secret = secret
+		self.timeout = timeout
+		self.retryInterval = retryInterval
+		self.retryAt = 0
+		self.connections = local()
+
+	@staticmethod
+	def from_environment(namespace):
+		address, secret = os.environ.get("CACHE_SERVER_ADDRESS"), os.environ.get("CACHE_SERVER_SECRET")
+		# Entries can only be trusted when they are signed, so the shared tier stays off without a secret
+		return None if address is None or not secret else SharedCache(namespace, address, secret.encode())
+
+	def get(self, key):
+		if time() < self.retryAt: return None
+		connection = self.__connection()
+		connection.requestId += 1
+		requestId = str(connection.requestId).encode()
+		name = "{}:{}".format(self.namespace, key).encode()
+
+		try:
+			connection.socket.send_multipart([requestId, b"get", name])
+			deadline = time() + self.timeout / 1000
+			while connection.socket.poll(max(0, int((deadline - time()) * 1000))) != 0:
+				response = connection.socket.recv_multipart()
+				if response[0] != requestId: continue
+				if len(response) == 1: return None
+				_, expiry, payload = response
+				signature, data = payload[:32], payload[32:]
+				# The cache server is unauthenticated and only stores what clients send, so payloads are unpickled only when they carry a signature made with the shared secret for this key and expiry
+				if not hmac.compare_digest(signature, self.sign(name, expiry, data)): return None
+				return pickle.loads(data), (None if expiry == b"" else float(expiry))
+		except:
+			pass
+
+		# Back off so that an unavailable cache server doesn't add latency to every lookup
+		self.retryAt = time() + self.retryInterval
+		self.__disconnect()
+		return None
+
+	def set(self, key, value, expiry):
+		if time() < self.retryAt: return
+		try:
+			name, expiry, data = "{}:{}".format(self.namespace, key).encode(), b"" if expiry is None else str(expiry).encode(), pickle.dumps(value, -1)
+			self.__connection().socket.send_multipart([b"", b"set", name, expiry, self.sign(name, expiry, data) + data], flags=zmq.NOBLOCK)
+		except:
+			pass
+
+	def sign(self, name, expiry, data):
+		return hmac.new(self.secret, b"\0".join([name, expiry, data]), hashlib.sha256).digest()
+
+	def __connection(self):
+		if getattr(self.connections, "socket", None) is None:
+			self.connections.socket = SharedCache.zmqContext.socket(zmq.DEALER)
+			self.connections.socket.setsockopt(zmq.LINGER, 0)
+			self.connections.socket.setsockopt(zmq.SNDHWM, 1000)
+			self.connections.socket.connect(self.address)
+			self.connections.requestId = 0
+		return self.connections
+
+	def __disconnect(self):
+		socket = getattr(self.connections, "socket", None)
+		if socket is not None: socket.close()
+		self.connections.socket = None
+
+
+class SharedCacheServer(object):
+	def __init__(self, address, store=None):
+		self.address = address
+		self.store = SharedStore() if store is None else store
+
+	def run(self):
+		socket = zmq.Context.instance().socket(zmq.ROUTER)
+		socket.bind(self.address)
+
+		while True:
+			try:
+				request = socket.recv_multipart()
+				origin, requestId, command, key = request[:4]
+
+				if command == b"get":
+					entry = self.store.get(key.decode())
+					if entry is None: socket.send_multipart([origin, requestId])
+					else: socket.send_multipart([origin, requestId, b"" if entry[0] is None else str(entry[0]).encode(), entry[1]])
+				elif command == b"set":
+					self.store.set(key.decode(), None if request[4] == b"" else float(request[4]), request[5])
+
+			except (KeyboardInterrupt, SystemExit): return
+			except Exception:
+				pass
+
+
+if __name__ == "__main__":
+	address = sys.argv[1] if len(sys.argv) > 1 else os.environ.get("CACHE_SERVER_ADDRESS", "ipc:///tmp/alpha-cache")
+	print("[Startup]: Cache server is online at {}".format(address))
+	SharedCacheServer(address).run()
@@ -21,7 +21,7 @@ REQUIRES_PYTHON = '>=3.8.0'
 VERSION = '1.0.0'
 
 # What packages are required for this module to be executed?
-REQUIRED = []
+REQUIRED = ["pyzmq"]
 EXTRAS = {}
 
 # The rest you shouldn't have to touch too much :)
@@ -1 +1,2 @@
-from .core import *
\ No newline at end of file
+from .core import *
+from .statistics import StatisticsWriter
\ No newline at end of file
@@ -0,0 +1,60 @@
+import atexit
+import traceback
+from queue import Queue, Full, Empty
+from threading import Thread, Lock
+from time import time, sleep
+
+
+class StatisticsWriter(object):
+	def __init__(self, database, flushInterval=10, batchSize=500, maxQueueSize=10000):
+		self.database = database
+		self.flushInterval = flushInterval
+		self.batchSize = min(batchSize, 500)
+		self.queue = Queue(maxsize=maxQueueSize)
+
+		self.written = 0
+		self.dropped = 0
+		self.lock = Lock()
+
+		Thread(target=self.__loop, daemon=True).start()
+		atexit.register(self.flush_all)
+
+	def write(self, path, document):
+		try: self.queue.put_nowait((path, document))
+		except Full:
+			with self.lock: self.dropped += 1
+
+	def flush(self):
+		events = []
+		while len(events) < self.batchSize:
+			try: events.append(self.queue.get_nowait())
+			except Empty: break
+		if len(events) == 0: return 0
+
+		try:
+			batch = self.database.batch()
+			for path, document in events:
+				batch.set(self.database.document(path), document)
+			batch.commit()
+			with self.lock: self.written += len(events)
+		except:
+			print(traceback.format_exc())
+			with self.lock: self.dropped += len(events)
+		return len(events)
+
+	def flush_all(self):
+		while self.flush() == self.batchSize: pass
+
+	def __loop(self):
+		while True:
+			try:
+				deadline = time() + self.flushInterval
+				while self.queue.qsize() < self.batchSize and time() < deadline:
+					sleep(0.5)
+				self.flush_all()
+
+				with self.lock:
+					dropped, self.dropped = self.dropped, 0
+				if dropped != 0: print("[Statistics]: Dropped {} usage events".format(dropped))
+			except:
+				pass
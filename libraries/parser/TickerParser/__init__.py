@@ -1,4 +1,5 @@
 from .core import *
 from .ticker import Ticker
-from .exchange import Exchange
+from .exchange import Exchange, ExchangeRegistry
+from .precision import PrecisionTable
 from . import supported
\ No newline at end of file
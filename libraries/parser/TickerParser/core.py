@@ -1,78 +1,236 @@
 import os
+import time
 import zmq
+import zmq.asyncio
 import zlib
 import pickle
 from io import BytesIO
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Thread, Lock
 
 from .ticker import Ticker
 from .exchange import Exchange
+from .memo import ParserMemo
+from .precision import PrecisionTable
 from . import supported
 
 
-class TickerParser(object):
+class ParserClient(object):
+	# Endpoints are shared by both clients and only the transport differs, execute_parser_request returns the response directly on TickerParser and a coroutine on AsyncTickerParser
+	memo = ParserMemo()
+	precision = PrecisionTable()
+	precisionValidatedAt = 0
+	precisionFailures = 0
+	precisionRefreshing = False
+	precisionLock = Lock()
+	memoizedEndpoints = [b"find_exchange", b"process_known_tickers", b"get_coingecko_image", b"check_if_fiat"]
+
+	@staticmethod
+	def encode_request(endpoint, parameters):
+		return [endpoint, zlib.compress(pickle.dumps(parameters, -1))]
+
+	@staticmethod
+	def memo_key(endpoint, parameters):
+		return ParserMemo.key(endpoint, parameters) if endpoint in ParserClient.memoizedEndpoints else None
+
+	@staticmethod
+	def recall(key):
+		response = ParserClient.memo.get(key)
+		return None if response is None else pickle.loads(response)
+
+	@staticmethod
+	def decode_response(key, response):
+		response = zlib.decompress(response)
+		payload = pickle.loads(response)
+		if key is not None and payload is not None: ParserClient.memo.set(key, response)
+		return payload
+
+	@classmethod
+	def respond(cls, payload):
+		return payload
+
+	@staticmethod
+	def parses_exchanges_for(platform):
+		# The parser doesn't match exchanges for platforms without an exchange list, so those lookups are answered without a round trip
+		return platform in supported.cryptoExchanges or platform in supported.traditionalExchanges
+
+	@classmethod
+	def find_exchange(cls, raw, platform, bias):
+		if not ParserClient.parses_exchanges_for(platform): return cls.respond((None, None))
+		return cls.execute_parser_request(b"find_exchange", (raw, platform, bias))
+
+	@classmethod
+	def process_known_tickers(cls, ticker, exchange, platform, defaults, bias):
+		return cls.execute_parser_request(b"process_known_tickers", (ticker, exchange, platform, defaults, bias))
+
+	@classmethod
+	def find_ccxt_crypto_market(cls, ticker, exchange, platform, defaults):
+		return cls.execute_parser_request(b"find_ccxt_crypto_market", (ticker, exchange, platform, defaults))
+
+	@classmethod
+	def find_coingecko_crypto_market(cls, ticker):
+		return cls.execute_parser_request(b"find_coingecko_crypto_market", (ticker))
+
+	@classmethod
+	def find_iexc_market(cls, ticker, exchange):
+		return cls.execute_parser_request(b"find_iexc_market", (ticker, exchange))
+
+	@classmethod
+	def find_quandl_market(cls, ticker):
+		return cls.execute_parser_request(b"find_quandl_market", (ticker))
+
+	@classmethod
+	def get_coingecko_image(cls, base):
+		return cls.execute_parser_request(b"get_coingecko_image", (base))
+
+	@classmethod
+	def check_if_fiat(cls, tickerId):
+		return cls.execute_parser_request(b"check_if_fiat", (tickerId))
+
+	@classmethod
+	def get_listings(cls, ticker):
+		return cls.execute_parser_request(b"get_listings", (ticker))
+
+	@classmethod
+	def get_formatted_price(cls, exchange, symbol, price):
+		ParserClient.refresh_precision_table()
+		try:
+			response = ParserClient.precision.format_price(exchange, symbol, price)
+			if response is not None: return cls.respond(response)
+		except: pass
+		return cls.execute_parser_request(b"get_formatted_price", (exchange, symbol, price))
+
+	@classmethod
+	def get_formatted_amount(cls, exchange, symbol, price):
+		ParserClient.refresh_precision_table()
+		try:
+			response = ParserClient.precision.format_amount(exchange, symbol, price)
+			if response is not None: return cls.respond(response)
+		except: pass
+		return cls.execute_parser_request(b"get_formatted_amount", (exchange, symbol, price))
+
+	@staticmethod
+	def refresh_precision_table():
+		# Formatting never waits for the table, a due check starts a single background refresh and the previous table is used meanwhile
+		with ParserClient.precisionLock:
+			if ParserClient.precisionRefreshing or time.time() - ParserClient.precisionValidatedAt < ParserClient.memo.validationInterval * min(2 ** ParserClient.precisionFailures, 16): return
+			ParserClient.precisionRefreshing = True
+		Thread(target=ParserClient.download_precision_table, daemon=True).start()
+
+	@staticmethod
+	def download_precision_table():
+		# The table is only downloaded when its own generation changes, and failed refreshes back off
+		failures = 0
+		try:
+			generation = TickerParser.execute_parser_request(b"get_precision_generation", None)
+			if generation is not None and generation != ParserClient.precision.generation:
+				generation, exchanges = TickerParser.execute_parser_request(b"get_precision_table", None, timeout=30)
+				ParserClient.precision = PrecisionTable(exchanges, generation)
+		except:
+			failures = ParserClient.precisionFailures + 1
+		with ParserClient.precisionLock:
+			ParserClient.precisionValidatedAt, ParserClient.precisionFailures, ParserClient.precisionRefreshing = time.time(), failures, False
+
+
+class TickerParser(ParserClient):
 	zmqContext = zmq.Context.instance()
 
 	@staticmethod
 	def execute_parser_request(endpoint, parameters, timeout=5):
+		key = ParserClient.memo_key(endpoint, parameters)
+		if key is not None:
+			if ParserClient.memo.requires_validation():
+				try: ParserClient.memo.validate(TickerParser.execute_parser_request(b"get_generation", None))
+				except: ParserClient.memo.clear()
+			payload = ParserClient.recall(key)
+			if payload is not None: return payload
+
 		socket = TickerParser.zmqContext.socket(zmq.REQ)
-		payload, responseText = None, None
 		socket.connect("tcp://parser:6900")
 		socket.setsockopt(zmq.LINGER, 0)
 		poller = zmq.Poller()
 		poller.register(socket, zmq.POLLIN)
 
-		socket.send_multipart([endpoint, zlib.compress(pickle.dumps(parameters, -1))])
+		socket.send_multipart(ParserClient.encode_request(endpoint, parameters))
 		responses = poller.poll(timeout * 1000)
 
 		if len(responses) != 0:
 			[response] = socket.recv_multipart()
 			socket.close()
-			return pickle.loads(zlib.decompress(response))
+			return ParserClient.decode_response(key, response)
 		else:
 			socket.close()
 			raise Exception("time out")
-		return None
 
-	@staticmethod
-	def find_exchange(raw, platform, bias):
-		return TickerParser.execute_parser_request(b"find_exchange", (raw, platform, bias))
 
-	@staticmethod
-	def process_known_tickers(ticker, exchange, platform, defaults, bias):
-		return TickerParser.execute_parser_request(b"process_known_tickers", (ticker, exchange, platform, defaults, bias))
+class AsyncTickerParser(ParserClient):
+	zmqContext = zmq.asyncio.Context.instance()
+	prefetched = ContextVar("prefetched", default=None)
 
 	@staticmethod
-	def find_ccxt_crypto_market(ticker, exchange, platform, defaults):
-		return TickerParser.execute_parser_request(b"find_ccxt_crypto_market", (ticker, exchange, platform, defaults))
-
-	@staticmethod
-	def find_coingecko_crypto_market(ticker):
-		return TickerParser.execute_parser_request(b"find_coingecko_crypto_market", (ticker))
-
-	@staticmethod
-	def find_iexc_market(ticker, exchange):
-		return TickerParser.execute_parser_request(b"find_iexc_market", (ticker, exchange))
+	async def execute_parser_request(endpoint, parameters, timeout=5):
+		key = ParserClient.memo_key(endpoint, parameters)
+		if key is not None:
+			if ParserClient.memo.requires_validation():
+				try: ParserClient.memo.validate(await AsyncTickerParser.execute_parser_request(b"get_generation", None))
+				except: ParserClient.memo.clear()
+			payload = ParserClient.recall(key)
+			if payload is not None: return payload
+
+		prefetched = AsyncTickerParser.prefetched.get() if endpoint != b"batch" else None
+		if prefetched is not None:
+			response = prefetched.get(ParserMemo.key(endpoint, parameters) if key is None else key)
+			if response is not None: return pickle.loads(response)
+
+		socket = AsyncTickerParser.zmqContext.socket(zmq.REQ)
+		socket.connect("tcp://parser:6900")
+		socket.setsockopt(zmq.LINGER, 0)
+		poller = zmq.asyncio.Poller()
+		poller.register(socket, zmq.POLLIN)
 
-	@staticmethod
-	def find_quandl_market(ticker):
-		return TickerParser.execute_parser_request(b"find_quandl_market", (ticker))
+		await socket.send_multipart(ParserClient.encode_request(endpoint, parameters))
+		responses = await poller.poll(timeout * 1000)
 
-	@staticmethod
-	def get_coingecko_image(base):
-		return TickerParser.execute_parser_request(b"get_coingecko_image", (base))
-
-	@staticmethod
-	def check_if_fiat(tickerId):
-		return TickerParser.execute_parser_request(b"check_if_fiat", (tickerId))
+		if len(responses) != 0:
+			[response] = await socket.recv_multipart()
+			socket.close()
+			return ParserClient.decode_response(key, response)
+		else:
+			socket.close()
+			raise Exception("time out")
 
-	@staticmethod
-	def get_listings(ticker):
-		return TickerParser.execute_parser_request(b"get_listings", (ticker))
+	@classmethod
+	async def respond(cls, payload):
+		return payload
 
 	@staticmethod
-	def get_formatted_price(exchange, symbol, price):
-		return TickerParser.execute_parser_request(b"get_formatted_price", (exchange, symbol, price))
+	@contextmanager
+	def batched():
+		token = AsyncTickerParser.prefetched.set({})
+		try: yield
+		finally: AsyncTickerParser.prefetched.reset(token)
 
 	@staticmethod
-	def get_formatted_amount(exchange, symbol, price):
-		return TickerParser.execute_parser_request(b"get_formatted_amount", (exchange, symbol, price))
+	async def prefetch(requests):
+		prefetched = AsyncTickerParser.prefetched.get()
+		if prefetched is None: return
+
+		# Prefetching only saves round trips, so any failure leaves the lookups to their own requests instead of failing the command
+		try:
+			batch = {}
+			for endpoint, parameters in requests:
+				key = ParserMemo.key(endpoint, parameters)
+				if key in prefetched or key in batch: continue
+				if endpoint in ParserClient.memoizedEndpoints and ParserClient.memo.get(key) is not None: continue
+				batch[key] = (endpoint, pickle.dumps(parameters, -1))
+			if len(batch) == 0: return
+
+			responses = await AsyncTickerParser.execute_parser_request(b"batch", list(batch.values()))
+			if not isinstance(responses, list) or len(responses) != len(batch): return
+			for key, response in zip(batch, responses):
+				if response is None: continue
+				prefetched[key] = response
+				if key[0] in ParserClient.memoizedEndpoints: ParserClient.memo.set(key, response)
+		except Exception:
+			return
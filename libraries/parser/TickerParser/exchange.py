@@ -1,5 +1,7 @@
 import time
 import datetime
+from threading import Thread, Lock, Condition
+from contextlib import contextmanager
 import requests
 import json
 import ccxt
@@ -35,9 +37,114 @@ class Exchange(object):
 	def __hash__(self):
 		return hash(self.id)
 
+	def __getstate__(self):
+		# Clients that load markets are never pickled, services which need one get it from an ExchangeRegistry and the parser reloads its own
+		state = dict(self.__dict__)
+		if hasattr(self.properties, "load_markets"): state["properties"] = None
+		return state
+
 	def __str__(self):
 		return "{} [id: {}]".format(self.name, self.id)
 
+class ExchangeRegistry(object):
+	def __init__(self, refreshInterval=3600, clientsPerExchange=1):
+		self.refreshInterval = refreshInterval
+		self.clientsPerExchange = clientsPerExchange
+		self.exchanges = {}
+		self.locks = {}
+		self.pools = {}
+		self.lock = Lock()
+		if refreshInterval is not None:
+			Thread(target=self.__loop, daemon=True).start()
+
+	def get(self, id, marketType="crypto"):
+		exchange = self.exchanges.get(id)
+		if exchange is not None: return exchange
+
+		with self.lock:
+			lock = self.locks.setdefault(id, Lock())
+		with lock:
+			exchange = self.exchanges.get(id)
+			if exchange is None:
+				exchange = Exchange(id, marketType)
+				# An exchange whose markets failed to load is handed out without being kept, so the next request retries the load
+				if ExchangeRegistry.load(exchange): self.exchanges[id] = exchange
+		return exchange
+
+	@staticmethod
+	def load(exchange):
+		if not hasattr(exchange.properties, "load_markets"): return True
+		try:
+			exchange.properties.load_markets()
+			return True
+		except:
+			return False
+
+	@contextmanager
+	def checkout(self, exchange):
+		# ccxt clients throttle and reuse a session per instance, so each thread borrows a client of its own from a small pool per registered exchange
+		# Pools follow the registered generation, so a request that got its exchange before a market refresh borrows a client of the refreshed one
+		with self.lock:
+			registered = self.exchanges.get(exchange.id)
+			pool = self.pools.get(exchange.id)
+			if registered is not None and (pool is None or pool.exchange is not registered):
+				pool = self.pools[exchange.id] = ClientPool(registered, self.clientsPerExchange)
+		# Exchanges that were never registered belong to the request that loaded them
+		if registered is None:
+			yield exchange.properties
+			return
+		client = pool.acquire()
+		try: yield client
+		finally: pool.release(client)
+
+	def __loop(self):
+		while True:
+			try:
+				time.sleep(self.refreshInterval)
+				# Markets are reloaded on a fresh client which then replaces the cached one, so requests never read markets mid-reload
+				for exchange in list(self.exchanges.values()):
+					if not hasattr(exchange.properties, "load_markets"): continue
+					refreshed = Exchange(exchange.id, exchange.type, exchange.name, exchange.region)
+					if ExchangeRegistry.load(refreshed): self.exchanges[exchange.id] = refreshed
+			except:
+				pass
+
+class ClientPool(object):
+	sharedProperties = ["markets", "markets_by_id", "symbols", "ids", "currencies", "currencies_by_id", "codes"]
+
+	def __init__(self, exchange, size):
+		self.exchange = exchange
+		self.size = size
+		self.idle = [exchange.properties]
+		self.created = 1
+		self.condition = Condition()
+
+	def acquire(self):
+		with self.condition:
+			while len(self.idle) == 0 and self.created >= self.size: self.condition.wait()
+			if len(self.idle) != 0: return self.idle.pop()
+			self.created += 1
+		try:
+			return ClientPool.clone(self.exchange)
+		except:
+			with self.condition:
+				self.created -= 1
+				self.condition.notify()
+			raise
+
+	def release(self, client):
+		with self.condition:
+			self.idle.append(client)
+			self.condition.notify()
+
+	@staticmethod
+	def clone(exchange):
+		# Clones read the markets already loaded on the registered client instead of loading their own copy
+		properties = Exchange(exchange.id, exchange.type, exchange.name, exchange.region).properties
+		for attribute in ClientPool.sharedProperties:
+			if hasattr(exchange.properties, attribute) and hasattr(properties, attribute): setattr(properties, attribute, getattr(exchange.properties, attribute))
+		return properties
+
 class ProprietaryConnection(object):
 	def __init__(self, id):
 		self.id = id
@@ -50,15 +157,18 @@ class ProprietaryConnection(object):
 	def milliseconds(self):
 		return int(time.time() * 1000)
 
-	def load_markets(self):
+	def load_markets(self, reload=False):
+		if len(self.markets) != 0 and not reload: return self.markets
 		if self.id == "uniswap":
 			payload = {"query": "{ pairs { id token0 { symbol } token1 { symbol decimals } } }"}
 			response = requests.post("https://api.thegraph.com/subgraphs/name/uniswap/uniswap-v2", data=json.dumps(payload)).json()
+			symbols, markets = [], {}
 			for data in response["data"]["pairs"]:
 				symbol = "{}/{}".format(data["token0"]["symbol"].upper(), data["token1"]["symbol"].upper())
-				self.symbols.append(symbol)
-				self.markets[symbol] = {"base": data["token0"]["symbol"], "quote": data["token1"]["symbol"], "id": data["id"], "precision": {"price": int(data["token1"]["decimals"]), "amount": None}}
-			self.symbols.sort()
+				symbols.append(symbol)
+				markets[symbol] = {"base": data["token0"]["symbol"], "quote": data["token1"]["symbol"], "id": data["id"], "precision": {"price": int(data["token1"]["decimals"]), "amount": None}}
+			self.symbols, self.markets = sorted(symbols), markets
+		return self.markets
 
 	def fetch_ohlcv(self, symbol, timeframe="1d", since=None, limit=500):
 		if self.id == "uniswap":
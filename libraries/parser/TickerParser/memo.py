@@ -0,0 +1,71 @@
+import time
+import hashlib
+from threading import Lock
+from collections import OrderedDict, deque
+
+from .ticker import Ticker
+from .exchange import Exchange
+
+
+class ParserMemo(object):
+	def __init__(self, maxEntries=4096, maxSize=32 * 1024 * 1024, validationInterval=60):
+		self.maxEntries = maxEntries
+		self.maxSize = maxSize
+		self.validationInterval = validationInterval
+
+		self.entries = OrderedDict()
+		self.size = 0
+		self.generation = None
+		self.generations = deque(maxlen=4)
+		self.validatedAt = 0
+		self.lock = Lock()
+
+	@staticmethod
+	def key(endpoint, parameters):
+		return endpoint, hashlib.blake2b(repr(ParserMemo.normalize(parameters)).encode(), digest_size=16).digest()
+
+	@staticmethod
+	def normalize(value):
+		# Tickers and exchanges are keyed by what lookups read from them, their pickled bytes also carry state the parser ignores
+		if isinstance(value, Ticker): return ("Ticker", value.fingerprint())
+		elif isinstance(value, Exchange): return ("Exchange", value.id, value.type)
+		elif isinstance(value, (tuple, list)): return tuple(ParserMemo.normalize(e) for e in value)
+		elif isinstance(value, dict): return ("dict",) + tuple(sorted(((repr(k), ParserMemo.normalize(v)) for k, v in value.items()), key=repr))
+		return value
+
+	def get(self, key):
+		with self.lock:
+			response = self.entries.get(key)
+			if response is not None: self.entries.move_to_end(key)
+			return response
+
+	def set(self, key, response):
+		with self.lock:
+			previous = self.entries.pop(key, None)
+			if previous is not None: self.size -= len(previous)
+			self.entries[key] = response
+			self.size += len(response)
+
+			while len(self.entries) > self.maxEntries or self.size > self.maxSize:
+				_, evicted = self.entries.popitem(last=False)
+				self.size -= len(evicted)
+
+	def requires_validation(self):
+		with self.lock:
+			if time.time() - self.validatedAt < self.validationInterval: return False
+			self.validatedAt = time.time()
+			return True
+
+	def validate(self, generation):
+		# Replicas behind the parser service publish a refresh at slightly different times, so answers from a generation seen recently stay valid and only an unseen one clears the entries
+		with self.lock:
+			if generation is None or generation not in self.generations:
+				self.entries.clear()
+				self.size = 0
+			if generation is not None:
+				if generation in self.generations: self.generations.remove(generation)
+				self.generations.append(generation)
+			self.generation = generation
+
+	def clear(self):
+		self.validate(None)
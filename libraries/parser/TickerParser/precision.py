@@ -0,0 +1,47 @@
+from ccxt.base import decimal_to_precision as dtp
+
+
+class PrecisionTable(object):
+	def __init__(self, exchanges=None, generation=None):
+		self.exchanges = {} if exchanges is None else exchanges
+		self.generation = generation
+
+	@staticmethod
+	def build(exchanges, previous=None):
+		table = {}
+		for exchange in exchanges:
+			# Exchanges without a loaded client keep the precisions they were last published with
+			if exchange.properties is None and previous is not None and exchange.id in previous: table[exchange.id] = previous[exchange.id]
+			if exchange.properties is None or not hasattr(exchange.properties, "precisionMode") or exchange.properties.markets is None: continue
+			precisions = {}
+			for symbol, market in exchange.properties.markets.items():
+				precision = market.get("precision", {})
+				precisions[symbol] = (precision.get("price", 8), precision.get("amount", 8)) if isinstance(precision, dict) else (None, None)
+			table[exchange.id] = (exchange.properties.precisionMode, precisions)
+		return table
+
+	def format_price(self, exchangeId, symbol, price):
+		if exchangeId not in self.exchanges: return None
+		precisionMode, precisions = self.exchanges[exchangeId]
+		precision = precisions.get(symbol, (8, 8))[0]
+		price = float(dtp.decimal_to_precision(price, rounding_mode=dtp.ROUND, precision=precision, counting_mode=precisionMode, padding_mode=dtp.PAD_WITH_ZERO))
+		return ("{:,.%df}" % PrecisionTable.num_of_decimal_places(exchangeId, price, precision)).format(price)
+
+	def format_amount(self, exchangeId, symbol, amount):
+		if exchangeId not in self.exchanges: return None
+		precisionMode, precisions = self.exchanges[exchangeId]
+		precision = precisions.get(symbol, (8, 8))[1]
+		amount = float(dtp.decimal_to_precision(amount, rounding_mode=dtp.TRUNCATE, precision=precision, counting_mode=precisionMode, padding_mode=dtp.NO_PADDING))
+		return ("{:,.%df}" % PrecisionTable.num_of_decimal_places(exchangeId, amount, precision)).format(amount)
+
+	@staticmethod
+	def num_of_decimal_places(exchangeId, price, precision):
+		if exchangeId in ["bitmex", "ftx"]:
+			s = str(precision)
+			if "e" in s: return int(s.split("e-")[1])
+			elif not '.' in s: return 0
+			else: return len(s) - s.index('.') - 1
+		elif exchangeId in ["bitfinex2"]:
+			return precision - len(str(int(price)))
+		else:
+			return precision
@@ -1,3 +1,6 @@
+import hashlib
+
+
 class Ticker(object):
 	separators = {"+", "-", "*", "/", "^", "(", ")"}
 
@@ -19,6 +22,7 @@ class Ticker(object):
 		self.__symbol = "{}/{}".format(self.__base, self.__quote) if symbol is None and self.__base is not None and self.__quote is not None else symbol
 		self.__mcapRank = mcapRank
 		self.__isReversed = isReversed
+		self.__fingerprint = None
 
 		self.update_ticker_parts(hasParts)
 		self.update_properties()
@@ -34,6 +38,7 @@ class Ticker(object):
 		self.update_properties()
 
 	def update_properties(self):
+		self.__fingerprint = None
 		self.isAggregatedTicker = len(self.parts) > 1
 		if self.isAggregatedTicker:
 			self.base = None
@@ -63,6 +68,15 @@ class Ticker(object):
 	def __hash__(self):
 		return hash("{}{}{}{}{}{}{}{}".format(self.id, self.isReversed, self.name, self.base, self.quote, self.symbol, self.mcapRank, [hash(e) for e in self.parts]))
 
+	def fingerprint(self):
+		# Only tickers without parts keep their fingerprint, parts can be swapped or updated in place without the parent noticing; tickers pickled by older clients have no cached value
+		fingerprint = getattr(self, "_Ticker__fingerprint", None)
+		if fingerprint is None:
+			parts = [e if type(e) is str else e.fingerprint() for e in self.parts]
+			fingerprint = hashlib.blake2b(repr((self.id, self.isReversed, self.name, self.base, self.quote, self.symbol, self.mcapRank, parts)).encode(), digest_size=16).hexdigest()
+			if len(self.parts) == 0: self.__fingerprint = fingerprint
+		return fingerprint
+
 	def __str__(self):
 		return "{} [id: {}, {}/{}]".format(self.name, self.id, self.base, self.quote)
 
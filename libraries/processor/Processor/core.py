@@ -1,11 +1,14 @@
 import os
 import time
+import uuid
 import base64
+import asyncio
 import zmq.asyncio
 import zlib
 import pickle
 from io import BytesIO
 
+from TickerParser import AsyncTickerParser
 from DataRequest import ChartRequestHandler
 from DataRequest import HeatmapRequestHandler
 from DataRequest import PriceRequestHandler
@@ -13,6 +16,77 @@ from DataRequest import DetailRequestHandler
 from DataRequest import TradeRequestHandler
 
 
+class DataServerConnection(object):
+	def __init__(self, address, size=2):
+		self.address = address
+		self.size = size
+		self.sockets = []
+		self.listeners = []
+		self.pending = {}
+		self.cursor = 0
+
+	def connect(self):
+		if len(self.sockets) != 0: return
+		for _ in range(self.size):
+			socket = self.open_socket()
+			self.sockets.append(socket)
+			self.listeners.append(asyncio.ensure_future(self.listen(socket)))
+
+	def open_socket(self):
+		socket = Processor.zmqContext.socket(zmq.DEALER)
+		socket.connect(self.address)
+		socket.setsockopt(zmq.LINGER, 0)
+		return socket
+
+	async def listen(self, socket):
+		while True:
+			try:
+				requestId, *response = await socket.recv_multipart()
+			except asyncio.CancelledError: return
+			except zmq.ZMQError as exception:
+				self.replace(socket, exception)
+				return
+			except ValueError: continue
+
+			# Replies to requests that already timed out or were retried have no caller left and are dropped
+			future, _ = self.pending.pop(requestId, (None, None))
+			if future is not None and not future.done(): future.set_result(response)
+
+	def replace(self, socket, exception):
+		# Nothing reads from a socket once its listener stops, so requests sent on it fail right away and the socket is swapped for a new one
+		for requestId, (future, origin) in list(self.pending.items()):
+			if origin is socket and not future.done(): future.set_exception(exception)
+		socket.close()
+		if socket not in self.sockets or exception.errno == zmq.ETERM: return
+
+		index = self.sockets.index(socket)
+		replacement = self.open_socket()
+		self.sockets[index] = replacement
+		self.listeners[index] = asyncio.ensure_future(self.listen(replacement))
+
+	async def request(self, frames, timeout):
+		self.connect()
+		requestId = uuid.uuid4().bytes
+		future = asyncio.get_event_loop().create_future()
+
+		socket = self.sockets[self.cursor % len(self.sockets)]
+		self.cursor += 1
+		self.pending[requestId] = future, socket
+
+		try:
+			await socket.send_multipart([requestId] + frames)
+			return await asyncio.wait_for(future, timeout)
+		finally:
+			self.pending.pop(requestId, None)
+
+	def close(self):
+		for listener in self.listeners: listener.cancel()
+		for socket in self.sockets: socket.close()
+		self.sockets, self.listeners = [], []
+		for future, _ in self.pending.values(): future.cancel()
+		self.pending = {}
+
+
 class Processor(object):
 	clientId = b"public"
 	services = {
@@ -25,35 +99,40 @@ class Processor(object):
 		"ichibot": "tcp://ichibot-server:6900"
 	}
 	zmqContext = zmq.asyncio.Context.instance()
+	connections = {}
+	connectionsPerService = 2
+
+	@staticmethod
+	def get_connection(service):
+		address = Processor.services[service]
+		if address not in Processor.connections:
+			Processor.connections[address] = DataServerConnection(address, size=Processor.connectionsPerService)
+		return Processor.connections[address]
 
 	@staticmethod
 	async def execute_data_server_request(service, request, timeout=60, retries=3):
-		socket = Processor.zmqContext.socket(zmq.REQ)
-		payload, responseText = None, None
-		socket.connect(Processor.services[service])
-		socket.setsockopt(zmq.LINGER, 0)
-		poller = zmq.asyncio.Poller()
-		poller.register(socket, zmq.POLLIN)
-
-		request.timestamp = time.time()
-		await socket.send_multipart([Processor.clientId, bytes(service, encoding='utf8'), zlib.compress(pickle.dumps(request, -1))])
-		responses = await poller.poll(timeout * 1000)
-
-		if len(responses) != 0:
-			[response] = await socket.recv_multipart()
-			socket.close()
-			payload, responseText = pickle.loads(zlib.decompress(response))
-			if service in ["chart", "heatmap", "depth"] and payload is not None:
+		connection = Processor.get_connection(service)
+
+		# Replies are matched to requests by the first frame, which data servers echo back in place of the REQ delimiter
+		for attempt in range(retries):
+			request.timestamp = time.time()
+			try:
+				response = await connection.request([Processor.clientId, bytes(service, encoding='utf8'), zlib.compress(pickle.dumps(request, -1))], timeout)
+			except (asyncio.TimeoutError, zmq.ZMQError):
+				continue
+
+			# Images are sent as a raw frame after the metadata frame; older servers still embed them base64 encoded
+			payload, responseText = pickle.loads(zlib.decompress(response[0]))
+			if len(response) > 1:
+				payload = BytesIO(response[1])
+			elif service in ["chart", "heatmap", "depth"] and payload is not None:
 				payload = BytesIO(base64.decodebytes(payload))
-		else:
-			socket.close()
-			if retries == 1: raise Exception("time out")
-			else: payload, responseText = await Processor.execute_data_server_request(service, request, retries=retries-1)
+			return payload, responseText
 
-		return payload, responseText
+		raise Exception("time out")
 
 	@staticmethod
-	def process_chart_arguments(messageRequest, arguments, tickerId=None, platform=None, platformQueue=None, **kwargs):
+	async def process_chart_arguments(messageRequest, arguments, tickerId=None, platform=None, platformQueue=None, **kwargs):
 		if isinstance(tickerId, str): tickerId = tickerId[:25]
 		if platform is not None: platformQueue = [platform]
 		elif platformQueue is None: platformQueue = messageRequest.get_platform_order_for("charts")
@@ -71,8 +150,10 @@ class Processor(object):
 			accountId = messageRequest.accountId
 
 		requestHandler = ChartRequestHandler(accountId, authorId, tickerId, platformQueue, messageRequest=messageRequest, **kwargs)
-		for argument in arguments: requestHandler.parse_argument(argument)
-		if tickerId is not None: requestHandler.process_ticker()
+		with AsyncTickerParser.batched():
+			await requestHandler.prefetch_arguments(arguments)
+			for argument in arguments: await requestHandler.parse_argument(argument)
+			if tickerId is not None: await requestHandler.process_ticker()
 
 		requestHandler.set_defaults()
 		requestHandler.find_caveats()
@@ -81,7 +162,7 @@ class Processor(object):
 		return outputMessage, requestHandler
 
 	@staticmethod
-	def process_heatmap_arguments(messageRequest, arguments, platform=None, platformQueue=None, **kwargs):
+	async def process_heatmap_arguments(messageRequest, arguments, platform=None, platformQueue=None, **kwargs):
 		if platform is not None: platformQueue = [platform]
 		elif platformQueue is None: platformQueue = messageRequest.get_platform_order_for("heatmaps")
 
@@ -107,7 +188,7 @@ class Processor(object):
 		return outputMessage, requestHandler
 	
 	@staticmethod
-	def process_quote_arguments(messageRequest, arguments, tickerId=None, platform=None, platformQueue=None, **kwargs):
+	async def process_quote_arguments(messageRequest, arguments, tickerId=None, platform=None, platformQueue=None, **kwargs):
 		if isinstance(tickerId, str): tickerId = tickerId[:25]
 		if platform is not None: platformQueue = [platform]
 		elif platformQueue is None: platformQueue = messageRequest.get_platform_order_for("quotes")
@@ -125,8 +206,10 @@ class Processor(object):
 			accountId = messageRequest.accountId
 
 		requestHandler = PriceRequestHandler(accountId, authorId, tickerId, platformQueue, messageRequest=messageRequest, **kwargs)
-		for argument in arguments: requestHandler.parse_argument(argument)
-		if tickerId is not None: requestHandler.process_ticker()
+		with AsyncTickerParser.batched():
+			await requestHandler.prefetch_arguments(arguments)
+			for argument in arguments: await requestHandler.parse_argument(argument)
+			if tickerId is not None: await requestHandler.process_ticker()
 
 		requestHandler.set_defaults()
 		requestHandler.find_caveats()
@@ -135,7 +218,7 @@ class Processor(object):
 		return outputMessage, requestHandler
 
 	@staticmethod
-	def process_detail_arguments(messageRequest, arguments, tickerId=None, platform=None, platformQueue=None, **kwargs):
+	async def process_detail_arguments(messageRequest, arguments, tickerId=None, platform=None, platformQueue=None, **kwargs):
 		if isinstance(tickerId, str): tickerId = tickerId[:25]
 		if platform is not None: platformQueue = [platform]
 		elif platformQueue is None: platformQueue = messageRequest.get_platform_order_for("details")
@@ -153,8 +236,9 @@ class Processor(object):
 			accountId = messageRequest.accountId
 
 		requestHandler = DetailRequestHandler(accountId, authorId, tickerId, platformQueue, messageRequest=messageRequest, **kwargs)
-		for argument in arguments: requestHandler.parse_argument(argument)
-		if tickerId is not None: requestHandler.process_ticker()
+		with AsyncTickerParser.batched():
+			for argument in arguments: await requestHandler.parse_argument(argument)
+			if tickerId is not None: await requestHandler.process_ticker()
 
 		requestHandler.set_defaults()
 		requestHandler.find_caveats()
@@ -163,7 +247,7 @@ class Processor(object):
 		return outputMessage, requestHandler
 
 	@staticmethod
-	def process_trade_arguments(messageRequest, arguments, tickerId=None, platform=None, platformQueue=None, **kwargs):
+	async def process_trade_arguments(messageRequest, arguments, tickerId=None, platform=None, platformQueue=None, **kwargs):
 		if isinstance(tickerId, str): tickerId = tickerId[:25]
 		if platform is not None: platformQueue = [platform]
 		elif platformQueue is None: platformQueue = messageRequest.get_platform_order_for("trades")
@@ -181,11 +265,13 @@ class Processor(object):
 			accountId = messageRequest.accountId
 
 		requestHandler = TradeRequestHandler(accountId, authorId, tickerId, platformQueue, messageRequest=messageRequest, **kwargs)
-		for argument in arguments: requestHandler.parse_argument(argument)
-		if tickerId is not None: requestHandler.process_ticker()
+		with AsyncTickerParser.batched():
+			await requestHandler.prefetch_arguments(arguments)
+			for argument in arguments: await requestHandler.parse_argument(argument)
+			if tickerId is not None: await requestHandler.process_ticker()
 
 		requestHandler.set_defaults()
-		requestHandler.find_caveats()
+		await requestHandler.find_caveats()
 		outputMessage = requestHandler.get_preferred_platform()
 
 		return outputMessage, requestHandler
@@ -213,12 +299,12 @@ class Processor(object):
 		}
 
 		if fromBase not in ["USD", "USDT", "USDC", "DAI", "HUSD", "TUSD", "PAX", "USDK", "USDN", "BUSD", "GUSD", "USDS"]:
-			outputMessage, request = Processor.process_quote_arguments(messageRequest, [], tickerId=fromBase + "USD")
+			outputMessage, request = await Processor.process_quote_arguments(messageRequest, [], tickerId=fromBase + "USD")
 			if outputMessage is not None: return None, outputMessage
 			payload1, quoteText = await Processor.execute_data_server_request("quote", request)
 			if payload1 is None: return None, quoteText
 		if toBase not in ["USD", "USDT", "USDC", "DAI", "HUSD", "TUSD", "PAX", "USDK", "USDN", "BUSD", "GUSD", "USDS"]:
-			outputMessage, request = Processor.process_quote_arguments(messageRequest, [], tickerId="USD" + toBase)
+			outputMessage, request = await Processor.process_quote_arguments(messageRequest, [], tickerId="USD" + toBase)
 			if outputMessage is not None: return None, outputMessage
 			payload2, quoteText = await Processor.execute_data_server_request("quote", request)
 			if payload2 is None: return None, quoteText
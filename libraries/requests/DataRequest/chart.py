@@ -1,10 +1,12 @@
 import os
 import sys
+import hashlib
 import urllib
 import time
+import asyncio
 import re
 
-from TickerParser import TickerParser
+from TickerParser import AsyncTickerParser
 from .parameter import ChartParameter as Parameter
 from TickerParser import Ticker
 
@@ -27,7 +29,7 @@ class ChartRequestHandler(object):
 		for platform in self.platforms:
 			self.requests[platform] = ChartRequest(tickerId, platform, self.parserBias)
 
-	def parse_argument(self, argument):
+	async def parse_argument(self, argument):
 		for platform, request in self.requests.items():
 			if request.errorIsFatal: continue
 
@@ -61,11 +63,11 @@ class ChartRequestHandler(object):
 			if outputMessage is not None: finalOutput = outputMessage
 			elif success is not None and success: continue
 
-			outputMessage, success = request.process_special_tickers(argument)
+			outputMessage, success = await request.process_special_tickers(argument)
 			if outputMessage is not None: finalOutput = outputMessage
 			elif success is not None and success: continue
 
-			outputMessage, success = request.add_exchange(argument)
+			outputMessage, success = await request.add_exchange(argument)
 			if outputMessage is not None: finalOutput = outputMessage
 			elif success is not None and success: continue
 
@@ -78,9 +80,12 @@ class ChartRequestHandler(object):
 			else:
 				request.set_error(finalOutput)
 
-	def process_ticker(self):
-		for platform, request in self.requests.items():
-			request.process_ticker(self.defaults, self.parserBias)
+	async def prefetch_arguments(self, arguments):
+		await AsyncTickerParser.prefetch([(b"find_exchange", (argument, platform, self.parserBias)) for argument in arguments for platform, request in self.requests.items() if not request.errorIsFatal and AsyncTickerParser.parses_exchanges_for(platform)])
+
+	async def process_ticker(self):
+		await AsyncTickerParser.prefetch([(b"process_known_tickers", (part, request.exchange, platform, self.defaults, self.parserBias)) for platform, request in self.requests.items() for part in request.ticker.parts if type(part) is not str])
+		await asyncio.gather(*[request.process_ticker(self.defaults, self.parserBias) for request in self.requests.values()])
 
 	def get_preferred_platform(self):
 		currentMinimumErrors = sys.maxsize
@@ -707,11 +712,15 @@ class ChartRequest(object):
 		h4 = sorted([e.name for e in self.filters])
 		return hash("{}{}{}{}{}{}{}{}{}{}".format(self.ticker, self.exchange, self.currentTimeframe, h1, h2, h3, h4, self.numericalParameters, self.platform, self.requiresPro))
 
-	def process_ticker(self, defaults, bias):
+	def fingerprint(self):
+		timeframe = None if self.currentTimeframe is None else self.currentTimeframe.id
+		return hashlib.blake2b(repr((self.ticker.fingerprint(), None if self.exchange is None else self.exchange.id, timeframe, sorted([e.name for e in self.indicators]), sorted([e.name for e in self.chartStyle]), sorted([e.name for e in self.imageStyle]), sorted([e.name for e in self.filters]), self.numericalParameters, self.platform, self.requiresPro)).encode(), digest_size=16).hexdigest()
+
+	async def process_ticker(self, defaults, bias):
 		for i in range(len(self.ticker.parts)):
 			tickerPart = self.ticker.parts[i]
 			if type(tickerPart) is str: continue
-			updatedTicker, updatedExchange = TickerParser.process_known_tickers(tickerPart, self.exchange, self.platform, defaults, bias)
+			updatedTicker, updatedExchange = await AsyncTickerParser.process_known_tickers(tickerPart, self.exchange, self.platform, defaults, bias)
 			if updatedTicker is not None:
 				self.ticker.parts[i] = updatedTicker
 				if len(self.ticker.parts) == 1: self.exchange = updatedExchange
@@ -796,8 +805,8 @@ class ChartRequest(object):
 
 		return "`{}` range is not supported on {}.".format(argument, self.platform), False
 
-	def add_exchange(self, argument):
-		exchangeSupported, parsedExchange = TickerParser.find_exchange(argument, self.platform, self.parserBias)
+	async def add_exchange(self, argument):
+		exchangeSupported, parsedExchange = await AsyncTickerParser.find_exchange(argument, self.platform, self.parserBias)
 		if parsedExchange is not None and not self.hasExchange:
 			if not exchangeSupported:
 				outputMessage = "`{}` exchange is not supported by {}.".format(parsedExchange.name, self.platform)
@@ -871,7 +880,7 @@ class ChartRequest(object):
 			return None, True
 		except: return None, None
 
-	def process_special_tickers(self, argument):
+	async def process_special_tickers(self, argument):
 		noVolume = self.find_parameter_with_id("nv", type="chartStyle")
 
 		if argument in ["dom", "dominance"]:
@@ -898,28 +907,28 @@ class ChartRequest(object):
 		elif argument in ["longs", "long", "l"]:
 			if self.platform == "TradingView" and not self.ticker.id.endswith(("LONGS", "SHORTS")):
 				self.specialTickerTriggers.append("longs")
-				if not self.hasExchange: self.exchange = TickerParser.find_exchange("bitfinex", self.platform, self.parserBias)[1]
+				if not self.hasExchange: self.exchange = (await AsyncTickerParser.find_exchange("bitfinex", self.platform, self.parserBias))[1]
 				if noVolume not in self.chartStyle: self.chartStyle.append(noVolume)
 				return None, True
 			return "Bitfinex longs charts are only available on TradingView.", False
 		elif argument in ["shorts", "short", "s"]:
 			if self.platform == "TradingView" and not self.ticker.id.endswith(("LONGS", "SHORTS")):
 				self.specialTickerTriggers.append("shorts")
-				if not self.hasExchange: self.exchange = TickerParser.find_exchange("bitfinex", self.platform, self.parserBias)[1]
+				if not self.hasExchange: self.exchange = (await AsyncTickerParser.find_exchange("bitfinex", self.platform, self.parserBias))[1]
 				if noVolume not in self.chartStyle: self.chartStyle.append(noVolume)
 				return None, True
 			return "Bitfinex shorts charts are only available on TradingView.", False
 		elif argument in ["longs/shorts", "l/s", "ls"]:
 			if self.platform == "TradingView" and len(self.ticker.parts) == 1:
 				self.specialTickerTriggers.append("ls")
-				if not self.hasExchange: self.exchange = TickerParser.find_exchange("bitfinex", self.platform, self.parserBias)[1]
+				if not self.hasExchange: self.exchange = (await AsyncTickerParser.find_exchange("bitfinex", self.platform, self.parserBias))[1]
 				if noVolume not in self.chartStyle: self.chartStyle.append(noVolume)
 				return None, True
 			return "Bitfinex longs/shorts charts are only available on TradingView.", False
 		elif argument in ["shorts/longs", "s/l", "sl"]:
 			if self.platform == "TradingView" and len(self.ticker.parts) == 1:
 				self.specialTickerTriggers.append("sl")
-				if not self.hasExchange: self.exchange = TickerParser.find_exchange("bitfinex", self.platform, self.parserBias)[1]
+				if not self.hasExchange: self.exchange = (await AsyncTickerParser.find_exchange("bitfinex", self.platform, self.parserBias))[1]
 				if noVolume not in self.chartStyle: self.chartStyle.append(noVolume)
 				return None, True
 			return "Bitfinex shorts/longs charts are only available on TradingView.", False
@@ -1,8 +1,10 @@
 import sys
+import hashlib
 import urllib
 import time
+import asyncio
 
-from TickerParser import TickerParser
+from TickerParser import AsyncTickerParser
 from .parameter import DetailParameter as Parameter
 from TickerParser import Ticker
 
@@ -25,7 +27,7 @@ class DetailRequestHandler(object):
 		for platform in self.platforms:
 			self.requests[platform] = DetailRequest(tickerId, platform, self.parserBias)
 
-	def parse_argument(self, argument):
+	async def parse_argument(self, argument):
 		for platform, request in self.requests.items():
 			if request.errorIsFatal: continue
 
@@ -39,7 +41,7 @@ class DetailRequestHandler(object):
 			if outputMessage is not None: finalOutput = outputMessage
 			elif success is not None and success: continue
 
-			outputMessage, success = request.process_special_tickers(argument)
+			outputMessage, success = await request.process_special_tickers(argument)
 			if outputMessage is not None: finalOutput = outputMessage
 			elif success is not None and success: continue
 
@@ -48,9 +50,9 @@ class DetailRequestHandler(object):
 			else:
 				request.set_error(finalOutput)
 
-	def process_ticker(self):
-		for platform, request in self.requests.items():
-			request.process_ticker(self.defaults, self.parserBias)
+	async def process_ticker(self):
+		await AsyncTickerParser.prefetch([(b"process_known_tickers", (part, None, platform, self.defaults, self.parserBias)) for platform, request in self.requests.items() for part in request.ticker.parts if type(part) is not str])
+		await asyncio.gather(*[request.process_ticker(self.defaults, self.parserBias) for request in self.requests.values()])
 
 	def get_preferred_platform(self):
 		currentMinimumErrors = sys.maxsize
@@ -179,13 +181,16 @@ class DetailRequest(object):
 		h1 = sorted([e.name for e in self.filters])
 		return hash("{}{}{}{}".format(hash(self.ticker), h1, self.platform, self.requiresPro))
 
-	def process_ticker(self, defaults, bias):
+	def fingerprint(self):
+		return hashlib.blake2b(repr((self.ticker.fingerprint(), sorted([e.name for e in self.filters]), self.platform, self.requiresPro)).encode(), digest_size=16).hexdigest()
+
+	async def process_ticker(self, defaults, bias):
 		filters = [e.parsed[self.platform] for e in self.filters]
 
 		for i in range(len(self.ticker.parts)):
 			part = self.ticker.parts[i]
 			if type(part) is str: continue
-			updatedTicker, _ = TickerParser.process_known_tickers(part, None, self.platform, defaults, bias)
+			updatedTicker, _ = await AsyncTickerParser.process_known_tickers(part, None, self.platform, defaults, bias)
 			if updatedTicker is not None:
 				self.ticker.parts[i] = updatedTicker
 			else:
@@ -214,7 +219,7 @@ class DetailRequest(object):
 			return None, True
 		return None, None
 
-	def process_special_tickers(self, argument):
+	async def process_special_tickers(self, argument):
 		return None, None
 
 	def set_default_for(self, type):
@@ -1,4 +1,5 @@
 import sys
+import hashlib
 import urllib
 import time
 
@@ -368,6 +369,10 @@ class HeatmapRequest(object):
 		h3 = sorted([e.name for e in self.filters])
 		return hash("{}{}{}{}{}{}{}".format(self.currentTimeframe, h1, h2, h3, self.numericalParameters, self.platform, self.requiresPro))
 
+	def fingerprint(self):
+		timeframe = None if self.currentTimeframe is None else self.currentTimeframe.id
+		return hashlib.blake2b(repr((timeframe, sorted([e.name for e in self.heatmapStyle]), sorted([e.name for e in self.imageStyle]), sorted([e.name for e in self.filters]), self.numericalParameters, self.platform, self.requiresPro)).encode(), digest_size=16).hexdigest()
+
 	def add_parameter(self, argument, type):
 		isSupported = None
 		parsedParameter = None
@@ -1,8 +1,10 @@
 import sys
+import hashlib
 import urllib
 import time
+import asyncio
 
-from TickerParser import TickerParser
+from TickerParser import AsyncTickerParser
 from .parameter import PriceParameter as Parameter
 from TickerParser import Ticker
 
@@ -27,7 +29,7 @@ class PriceRequestHandler(object):
 		for platform in self.platforms:
 			self.requests[platform] = PriceRequest(tickerId, platform, self.parserBias)
 
-	def parse_argument(self, argument):
+	async def parse_argument(self, argument):
 		for platform, request in self.requests.items():
 			if request.errorIsFatal: continue
 
@@ -45,11 +47,11 @@ class PriceRequestHandler(object):
 			if outputMessage is not None: finalOutput = outputMessage
 			elif success is not None and success: continue
 
-			outputMessage, success = request.process_special_tickers(argument)
+			outputMessage, success = await request.process_special_tickers(argument)
 			if outputMessage is not None: finalOutput = outputMessage
 			elif success is not None and success: continue
 
-			outputMessage, success = request.add_exchange(argument)
+			outputMessage, success = await request.add_exchange(argument)
 			if outputMessage is not None: finalOutput = outputMessage
 			elif success is not None and success: continue
 
@@ -62,9 +64,12 @@ class PriceRequestHandler(object):
 			else:
 				request.set_error(finalOutput)
 
-	def process_ticker(self):
-		for platform, request in self.requests.items():
-			request.process_ticker(self.defaults, self.parserBias)
+	async def prefetch_arguments(self, arguments):
+		await AsyncTickerParser.prefetch([(b"find_exchange", (argument, platform, self.parserBias)) for argument in arguments for platform, request in self.requests.items() if not request.errorIsFatal and AsyncTickerParser.parses_exchanges_for(platform)])
+
+	async def process_ticker(self):
+		await AsyncTickerParser.prefetch([(b"process_known_tickers", (part, request.exchange, platform, self.defaults, self.parserBias)) for platform, request in self.requests.items() for part in request.ticker.parts if type(part) is not str])
+		await asyncio.gather(*[request.process_ticker(self.defaults, self.parserBias) for request in self.requests.values()])
 
 	def get_preferred_platform(self):
 		currentMinimumErrors = sys.maxsize
@@ -290,7 +295,7 @@ class PriceRequestHandler(object):
 		return default
 
 	def can_cache(self):
-		return self.requests[self.currentPlatform].canCache
+		return self.requests[self.currentPlatform].canCache and not self.isPaperTrade
 
 	def __str__(self):
 		return "<Request: {}, {}>".format(self.get_ticker(), self.get_exchange())
@@ -373,17 +378,21 @@ class PriceRequest(object):
 		h1 = sorted([e.name for e in self.filters])
 		return hash("{}{}{}{}{}{}".format(hash(self.ticker), hash(self.exchange), h1, self.numericalParameters, self.platform, self.requiresPro))
 
-	def process_ticker(self, defaults, bias):
+	def fingerprint(self):
+		# Computed on every call, requests are edited after their first fingerprint and older clients send requests without any cached value
+		return hashlib.blake2b(repr((self.ticker.fingerprint(), None if self.exchange is None else self.exchange.id, sorted([e.name for e in self.filters]), self.numericalParameters, self.platform, self.requiresPro)).encode(), digest_size=16).hexdigest()
+
+	async def process_ticker(self, defaults, bias):
 		filters = [e.parsed[self.platform] for e in self.filters]
 		if any([e in filters for e in ["funding", "oi"]]):
-			if not self.hasExchange: self.exchange = TickerParser.find_exchange("bitmex", self.platform, self.parserBias)[1]
+			if not self.hasExchange: self.exchange = (await AsyncTickerParser.find_exchange("bitmex", self.platform, self.parserBias))[1]
 		elif any([e in filters for e in ["ls", "sl"]]):
-			if not self.hasExchange: self.exchange = TickerParser.find_exchange("bitfinex", self.platform, self.parserBias)[1]
+			if not self.hasExchange: self.exchange = (await AsyncTickerParser.find_exchange("bitfinex", self.platform, self.parserBias))[1]
 
 		for i in range(len(self.ticker.parts)):
 			part = self.ticker.parts[i]
 			if type(part) is str: continue
-			updatedTicker, updatedExchange = TickerParser.process_known_tickers(part, self.exchange, self.platform, defaults, bias)
+			updatedTicker, updatedExchange = await AsyncTickerParser.process_known_tickers(part, self.exchange, self.platform, defaults, bias)
 			if updatedTicker is not None:
 				self.ticker.parts[i] = updatedTicker
 				if not self.ticker.isAggregatedTicker: self.exchange = updatedExchange
@@ -403,8 +412,8 @@ class PriceRequest(object):
 					break
 		return isSupported, parsedParameter
 
-	def add_exchange(self, argument):
-		exchangeSupported, parsedExchange = TickerParser.find_exchange(argument, self.platform, self.parserBias)
+	async def add_exchange(self, argument):
+		exchangeSupported, parsedExchange = await AsyncTickerParser.find_exchange(argument, self.platform, self.parserBias)
 		if parsedExchange is not None and not self.hasExchange:
 			if not exchangeSupported:
 				outputMessage = "`{}` exchange is not supported by {}.".format(parsedExchange.name, self.platform)
@@ -444,7 +453,7 @@ class PriceRequest(object):
 			return None, True
 		except: return None, None
 
-	def process_special_tickers(self, argument):
+	async def process_special_tickers(self, argument):
 		return None, None
 
 	def set_default_for(self, type):
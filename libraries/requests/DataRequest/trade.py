@@ -1,8 +1,10 @@
 import sys
+import hashlib
 import urllib
 import time
+import asyncio
 
-from TickerParser import TickerParser
+from TickerParser import AsyncTickerParser
 from .parameter import TradeParameter as Parameter
 from TickerParser import Ticker
 
@@ -25,7 +27,7 @@ class TradeRequestHandler(object):
 		for platform in self.platforms:
 			self.requests[platform] = TradeRequest(tickerId, platform, self.parserBias)
 
-	def parse_argument(self, argument):
+	async def parse_argument(self, argument):
 		for platform, request in self.requests.items():
 			if request.errorIsFatal: continue
 
@@ -39,11 +41,11 @@ class TradeRequestHandler(object):
 			if outputMessage is not None: finalOutput = outputMessage
 			elif success is not None and success: continue
 
-			outputMessage, success = request.process_special_tickers(argument)
+			outputMessage, success = await request.process_special_tickers(argument)
 			if outputMessage is not None: finalOutput = outputMessage
 			elif success is not None and success: continue
 
-			outputMessage, success = request.add_exchange(argument)
+			outputMessage, success = await request.add_exchange(argument)
 			if outputMessage is not None: finalOutput = outputMessage
 			elif success is not None and success: continue
 
@@ -56,9 +58,12 @@ class TradeRequestHandler(object):
 			else:
 				request.set_error(finalOutput)
 
-	def process_ticker(self):
-		for platform, request in self.requests.items():
-			request.process_ticker(self.defaults, self.parserBias)
+	async def prefetch_arguments(self, arguments):
+		await AsyncTickerParser.prefetch([(b"find_exchange", (argument, platform, self.parserBias)) for argument in arguments for platform, request in self.requests.items() if not request.errorIsFatal and AsyncTickerParser.parses_exchanges_for(platform)])
+
+	async def process_ticker(self):
+		await AsyncTickerParser.prefetch([(b"process_known_tickers", (part, request.exchange, platform, self.defaults, self.parserBias)) for platform, request in self.requests.items() for part in request.ticker.parts if type(part) is not str])
+		await asyncio.gather(*[request.process_ticker(self.defaults, self.parserBias) for request in self.requests.values()])
 
 	def get_preferred_platform(self):
 		currentMinimumErrors = sys.maxsize
@@ -106,11 +111,11 @@ class TradeRequestHandler(object):
 			for type in request.requestParameters:
 				request.set_default_for(type)
 
-	def find_caveats(self):
+	async def find_caveats(self):
 		for platform, request in self.requests.items():
 			if platform == "Ichibot":
 				if request.exchange is None:
-					request.exchange = TickerParser.find_exchange("ftx", platform, request.parserBias)[1]
+					request.exchange = (await AsyncTickerParser.find_exchange("ftx", platform, request.parserBias))[1]
 
 	def requires_pro(self):
 		return self.requests[self.currentPlatform].requiresPro
@@ -200,13 +205,16 @@ class TradeRequest(object):
 		h1 = sorted([e.name for e in self.filters])
 		return hash("{}{}{}{}{}{}".format(self.ticker, self.exchange, h1, self.numericalParameters, self.platform, self.requiresPro))
 
-	def process_ticker(self, defaults, bias):
+	def fingerprint(self):
+		return hashlib.blake2b(repr((self.ticker.fingerprint(), None if self.exchange is None else self.exchange.id, sorted([e.name for e in self.filters]), self.numericalParameters, self.platform, self.requiresPro)).encode(), digest_size=16).hexdigest()
+
+	async def process_ticker(self, defaults, bias):
 		filters = [e.parsed[self.platform] for e in self.filters]
 
 		for i in range(len(self.ticker.parts)):
 			part = self.ticker.parts[i]
 			if type(part) is str: continue
-			updatedTicker, updatedExchange = TickerParser.process_known_tickers(part, self.exchange, self.platform, defaults, bias)
+			updatedTicker, updatedExchange = await AsyncTickerParser.process_known_tickers(part, self.exchange, self.platform, defaults, bias)
 			if updatedTicker is not None:
 				self.ticker.parts[i] = updatedTicker
 				if not self.ticker.isAggregatedTicker: self.exchange = updatedExchange
@@ -226,8 +234,8 @@ class TradeRequest(object):
 					break
 		return isSupported, parsedParameter
 
-	def add_exchange(self, argument):
-		exchangeSupported, parsedExchange = TickerParser.find_exchange(argument, self.platform, self.parserBias)
+	async def add_exchange(self, argument):
+		exchangeSupported, parsedExchange = await AsyncTickerParser.find_exchange(argument, self.platform, self.parserBias)
 		if parsedExchange is not None and not self.hasExchange:
 			if not exchangeSupported:
 				outputMessage = "`{}` exchange is not supported by {}.".format(parsedExchange.name, self.platform)
@@ -257,7 +265,7 @@ class TradeRequest(object):
 			return None, True
 		except: return None, None
 
-	def process_special_tickers(self, argument):
+	async def process_special_tickers(self, argument):
 		return None, None
 
 	def set_default_for(self, type):
@@ -0,0 +1,11 @@
+import os
+
+from Cache import SharedCacheServer
+
+
+if __name__ == "__main__":
+	os.environ["PRODUCTION_MODE"] = os.environ["PRODUCTION_MODE"] if "PRODUCTION_MODE" in os.environ and os.environ["PRODUCTION_MODE"] else ""
+	print("[Startup]: Cache Server is in startup, running in {} mode.".format("production" if os.environ["PRODUCTION_MODE"] else "development"))
+	cacheServer = SharedCacheServer("tcp://*:6900")
+	print("[Startup]: Cache Server is online")
+	cacheServer.run()
@@ -0,0 +1,6 @@
+if [[ $PRODUCTION_MODE == "1" ]]
+then
+	python -u app/cache_server.py
+else
+	python -u app/cache_server.py
+fi
\ No newline at end of file
@@ -12,8 +12,8 @@ import ccxt
 from iexfinance.stocks import Stock
 from google.cloud import error_reporting
 
-from Cache import Cache
-from TickerParser import Exchange
+from Cache import Cache, SharedCache
+from TickerParser import ExchangeRegistry
 
 from helpers.utils import Utils
 
@@ -27,7 +27,8 @@ class CandleProcessor(object):
 		signal.signal(signal.SIGTERM, self.exit_gracefully)
 
 		self.logging = error_reporting.Client(service="candle_server")
-		self.cache = Cache(ttl=30)
+		self.cache = Cache(ttl=30, maxSize=32 * 1024 * 1024, negativeTtl=15, shared=SharedCache.from_environment("candles"))
+		self.exchanges = ExchangeRegistry()
 
 		context = zmq.Context.instance()
 		self.socket = context.socket(zmq.ROUTER)
@@ -64,34 +65,34 @@ class CandleProcessor(object):
 
 		for platform in request.platforms:
 			request.set_current(platform=platform)
-			hashCode = hash(request.requests[platform])
-			fromCache = False
-
-			if request.can_cache() and self.cache.has(hashCode):
-				payload, updatedCandleMessage = self.cache.get(hashCode), None
-				fromCache = True
-			elif platform == "CCXT":
-				payload, updatedCandleMessage = self.request_ccxt_candles(request)
-			elif platform == "IEXC":
-				payload, updatedCandleMessage = self.request_iexc_candles(request)
-			elif platform == "Quandl":
-				pass
+			hashCode = request.requests[platform].fingerprint()
+
+			if request.can_cache():
+				payload, updatedCandleMessage = self.cache.get_or_compute(hashCode, lambda: self.request_platform_candle(platform, request), isCacheable=lambda response: response[0] is not None)
+			else:
+				payload, updatedCandleMessage = self.request_platform_candle(platform, request)
 
 			if payload is not None:
-				if request.can_cache() and not fromCache: self.cache.set(hashCode, payload)
 				return payload, updatedCandleMessage
 			elif updatedCandleMessage is not None:
 				candleMessage = updatedCandleMessage
 
 		return None, candleMessage
 
+	def request_platform_candle(self, platform, request):
+		if platform == "CCXT":
+			return self.request_ccxt_candles(request)
+		elif platform == "IEXC":
+			return self.request_iexc_candles(request)
+		return None, None
+
 	def request_ccxt_candles(self, request):
 		ticker = request.get_ticker()
 		exchange = request.get_exchange()
 
 		try:
 			if exchange is None: return None, None
-			exchange = Exchange(exchange.id, "crypto")
+			exchange = self.exchanges.get(exchange.id)
 
 			try:
 				rawData = exchange.properties.fetch_ohlcv(ticker.symbol, timeframe="1m", limit=3)
@@ -1,6 +1,7 @@
 import os
 import signal
 import time
+import copy
 import uuid
 import zmq
 import zlib
@@ -14,7 +15,8 @@ from iexfinance.stocks import Stock
 from google.cloud import firestore, error_reporting
 from markdownify import markdownify as md
 
-from Cache import Cache
+from Cache import Cache, SharedCache
+from DatabaseConnector import StatisticsWriter
 
 
 database = firestore.Client()
@@ -29,7 +31,8 @@ class DetailProcessor(object):
 		signal.signal(signal.SIGTERM, self.exit_gracefully)
 
 		self.logging = error_reporting.Client(service="details_server")
-		self.cache = Cache(ttl=60)
+		self.cache = Cache(ttl=60, maxSize=8 * 1024 * 1024, staleTtl=240, negativeTtl=30, shared=SharedCache.from_environment("details"))
+		self.statistics = StatisticsWriter(database)
 
 		context = zmq.Context.instance()
 		self.socket = context.socket(zmq.ROUTER)
@@ -66,21 +69,18 @@ class DetailProcessor(object):
 
 		for platform in request.platforms:
 			request.set_current(platform=platform)
-			hashCode = hash(request.requests[platform])
-			fromCache = False
+			hashCode = request.requests[platform].fingerprint()
+			# A stale hit is refreshed in the background after the request moved on to other platforms, so the refresh gets its own copy of the ticker
+			ticker = copy.deepcopy(request.get_ticker())
 
-			if request.can_cache() and self.cache.has(hashCode):
-				payload, updatedQuoteMessage = self.cache.get(hashCode), None
-				fromCache = True
-			elif platform == "CoinGecko":
-				payload, updatedQuoteMessage = self.request_coingecko_details(request)
-			elif platform == "IEXC":
-				payload, updatedQuoteMessage = self.request_iexc_details(request)
+			if request.can_cache():
+				payload, updatedQuoteMessage = self.cache.get_or_compute(hashCode, lambda platform=platform, ticker=ticker: self.request_platform_detail(platform, ticker), staleWhileRevalidate=True, isCacheable=lambda response: response[0] is not None)
+			else:
+				payload, updatedQuoteMessage = self.request_platform_detail(platform, ticker)
 
 			if payload is not None:
-				if request.can_cache() and not fromCache: self.cache.set(hashCode, payload)
 				if request.authorId != 401328409499664394 and request.requests[platform].ticker.base is not None:
-					database.document("dataserver/statistics/{}/{}".format(platform, str(uuid.uuid4()))).set({
+					self.statistics.write("dataserver/statistics/{}/{}".format(platform, str(uuid.uuid4())), {
 						"timestamp": time.time(),
 						"authorId": str(request.authorId),
 						"ticker": {
@@ -97,9 +97,14 @@ class DetailProcessor(object):
 
 		return None, tradeMessage
 
-	def request_coingecko_details(self, request):
-		ticker = request.get_ticker()
+	def request_platform_detail(self, platform, ticker):
+		if platform == "CoinGecko":
+			return self.request_coingecko_details(ticker)
+		elif platform == "IEXC":
+			return self.request_iexc_details(ticker)
+		return None, None
 
+	def request_coingecko_details(self, ticker):
 		try:
 			try:
 				assetData = self.coinGecko.get_coin_by_id(id=ticker.symbol, localization="false", tickers=False, market_data=True, community_data=True, developer_data=True)
@@ -159,9 +164,7 @@ class DetailProcessor(object):
 			if os.environ["PRODUCTION_MODE"]: self.logging.report_exception(user=ticker.id)
 			return None, None
 	
-	def request_iexc_details(self, request):
-		ticker = request.get_ticker()
-
+	def request_iexc_details(self, ticker):
 		try:
 			try:
 				stock = Stock(ticker.id, token=os.environ["IEXC_KEY"])
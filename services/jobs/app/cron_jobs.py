@@ -16,6 +16,7 @@ import pickle
 from google.cloud import firestore, error_reporting
 
 from DatabaseConnector import DatabaseConnector
+from TickerParser import ExchangeRegistry
 from helpers.utils import Utils
 
 
@@ -39,6 +40,7 @@ class CronJobs(object):
 		signal.signal(signal.SIGTERM, self.exit_gracefully)
 
 		self.logging = error_reporting.Client(service="jobs")
+		self.exchanges = ExchangeRegistry()
 
 	def exit_gracefully(self):
 		print("[Startup]: Cron Job handler is exiting")
@@ -276,25 +278,26 @@ class CronJobs(object):
 										reference.delete()
 
 									else:
+										fees = self.exchanges.get(exchange.id).properties.markets[ticker.symbol]
 										if order["orderType"] == "buy":
 											if reduceOnly: execAmount = min(abs(quoteOrder["amount"]), order["price"] * execAmount) / order["price"]
-											orderFee = execAmount * exchange.properties.markets[ticker.symbol]["maker"]
+											orderFee = execAmount * fees["maker"]
 
 											baseOrder["amount"] += execAmount - orderFee
 										elif order["orderType"] == "sell":
 											if reduceOnly: execAmount = min(abs(baseOrder["amount"]), execAmount)
-											orderFee = execAmount * exchange.properties.markets[ticker.symbol]["maker"]
+											orderFee = execAmount * fees["maker"]
 
 											quoteOrder["amount"] += (execAmount - orderFee) * order["price"]
 										elif order["orderType"] == "stop-buy":
 											if reduceOnly: execAmount = min(abs(quoteOrder["amount"]), order["price"] * execAmount) / order["price"]
-											orderFee = execAmount * exchange.properties.markets[ticker.symbol]["taker"]
+											orderFee = execAmount * fees["taker"]
 
 											baseOrder["amount"] += execAmount - orderFee
 											quoteOrder["amount"] -= order["price"] * execAmount
 										elif order["orderType"] == "stop-sell":
 											if reduceOnly: execAmount = min(abs(baseOrder["amount"]), execAmount)
-											orderFee = execAmount * exchange.properties.markets[ticker.symbol]["taker"]
+											orderFee = execAmount * fees["taker"]
 
 											baseOrder["amount"] -= execAmount
 											quoteOrder["amount"] += (execAmount - orderFee) * order["price"]
@@ -0,0 +1,60 @@
+import json
+import hashlib
+
+
+class ParserIndex(object):
+	def __init__(self, previous=None):
+		self.generation = None
+		self.precisionGeneration = None
+
+		if previous is None:
+			self.exchanges = {}
+			self.markets = {}
+			self.exchangeAliases = {}
+			self.exchangeFallbackAliases = {}
+			self.ccxtIndex = {}
+			self.ccxtMarketCandidates = {}
+			self.ccxtMarketIndex = {}
+			self.listingsIndex = {}
+			self.precisionTable = {}
+			self.coinGeckoIndex = {}
+			self.coinGeckoPositions = {}
+			self.coinGeckoPrefixIndex = {}
+			self.coinGeckoSortedIndex = []
+			self.iexcStocksIndex = {}
+			self.iexcForexIndex = {}
+			self.coingeckoVsCurrencies = []
+			self.coingeckoFiatCurrencies = []
+
+		else:
+			# Published indexes are never modified, a refresh replaces whole structures on the copy and keeps the rest of the previous generation. Only the exchange registry and its market tables are copied since refreshes add to them
+			self.exchanges = dict(previous.exchanges)
+			self.markets = dict(previous.markets)
+			self.exchangeAliases = previous.exchangeAliases
+			self.exchangeFallbackAliases = previous.exchangeFallbackAliases
+			self.ccxtIndex = previous.ccxtIndex
+			self.ccxtMarketCandidates = previous.ccxtMarketCandidates
+			self.ccxtMarketIndex = previous.ccxtMarketIndex
+			self.listingsIndex = previous.listingsIndex
+			self.precisionTable = previous.precisionTable
+			self.precisionGeneration = previous.precisionGeneration
+			self.coinGeckoIndex = previous.coinGeckoIndex
+			self.coinGeckoPositions = previous.coinGeckoPositions
+			self.coinGeckoPrefixIndex = previous.coinGeckoPrefixIndex
+			self.coinGeckoSortedIndex = previous.coinGeckoSortedIndex
+			self.iexcStocksIndex = previous.iexcStocksIndex
+			self.iexcForexIndex = previous.iexcForexIndex
+			self.coingeckoVsCurrencies = previous.coingeckoVsCurrencies
+			self.coingeckoFiatCurrencies = previous.coingeckoFiatCurrencies
+
+	def seal(self):
+		# Generations are derived from the source data rather than the time of the refresh, so every replica that loaded the same data reports the same generation
+		exchanges = {exchangeId: (exchange.name, exchange.type, exchange.region, None if exchangeId in self.markets else getattr(exchange.properties, "symbols", None)) for exchangeId, exchange in self.exchanges.items()}
+		markets = {exchangeId: [(market.symbol, market.id, market.base, market.quote, market.name, market.active) for market in table.markets.values()] for exchangeId, table in self.markets.items()}
+		self.generation = ParserIndex.digest([exchanges, markets, self.coinGeckoIndex, self.iexcStocksIndex, self.iexcForexIndex, self.coingeckoVsCurrencies, self.coingeckoFiatCurrencies])
+		# The precision table only changes with market precisions, so clients keep their copy across most index generations
+		self.precisionGeneration = ParserIndex.digest(self.precisionTable)
+
+	@staticmethod
+	def digest(value):
+		return int.from_bytes(hashlib.blake2b(json.dumps(value, sort_keys=True, default=str).encode(), digest_size=8).digest(), "big")
@@ -0,0 +1,58 @@
+import sys
+
+from TickerParser import Ticker
+
+
+class Market(object):
+	__slots__ = ["symbol", "id", "base", "quote", "name", "active"]
+
+	def __init__(self, symbol, market, exchange):
+		self.symbol = Market.intern(symbol)
+		self.id = Market.intern(market.get("id"))
+		self.base = Market.intern(market["base"])
+		self.quote = Market.intern(market["quote"])
+		self.name = Market.intern(Ticker.generate_market_name(symbol, exchange))
+		# Markets without an active flag are treated as active, an explicit None is kept since lookups disagree on it
+		self.active = market.get("active", True)
+
+	@staticmethod
+	def intern(value):
+		return sys.intern(value) if isinstance(value, str) else value
+
+
+class MarketTable(object):
+	__slots__ = ["symbols", "markets"]
+
+	def __init__(self, exchange):
+		self.symbols = [Market.intern(symbol) for symbol in exchange.properties.symbols]
+		self.markets = {}
+		for symbol in self.symbols:
+			self.markets[symbol] = Market(symbol, exchange.properties.markets[symbol], exchange)
+
+	def compact(self, exchange):
+		# Lookups only read the records, the exchange keeps just the fields services read from a parsed exchange, so the parsed ccxt markets and everything derived from them can be released
+		markets = {}
+		for symbol, market in exchange.properties.markets.items():
+			record = self.markets.get(symbol)
+			compact = {key: market[key] for key in ["active", "maker", "taker"] if key in market}
+			if record is None: compact.update({key: market[key] for key in ["symbol", "id", "base", "quote"] if key in market})
+			else: compact.update({"symbol": record.symbol, "id": record.id, "base": record.base, "quote": record.quote})
+			precision = market.get("precision", {})
+			compact["precision"] = {key: precision[key] for key in ["price", "amount"] if key in precision} if isinstance(precision, dict) else precision
+			markets[symbol] = compact
+
+		# Markets by id are rebuilt in the shape the installed ccxt uses, so that a later load_markets call still sees loaded markets instead of reparsing the compact ones
+		marketsById = getattr(exchange.properties, "markets_by_id", None)
+		if marketsById:
+			isListed = isinstance(next(iter(marketsById.values())), list)
+			marketsById = {}
+			for market in markets.values():
+				if isListed: marketsById.setdefault(market["id"], []).append(market)
+				else: marketsById[market["id"]] = market
+			exchange.properties.markets_by_id = marketsById
+			exchange.properties.ids = list(marketsById)
+
+		exchange.properties.markets = markets
+		exchange.properties.symbols = self.symbols
+		if hasattr(exchange.properties, "currencies_by_id"): exchange.properties.currencies_by_id = None
+		if hasattr(exchange.properties, "currencies"): exchange.properties.currencies = {}
@@ -1,5 +1,7 @@
 import os
 import sys
+import gc
+import select
 import signal
 import time
 import datetime
@@ -7,51 +9,80 @@ import pytz
 import zmq
 import zlib
 import pickle
+import tempfile
 import traceback
-from threading import Thread
+from bisect import bisect_left
+from array import array
+from threading import Thread, Semaphore, Lock
+from concurrent.futures import Future, wait, FIRST_COMPLETED
 import requests
 
 import ccxt
-from ccxt.base import decimal_to_precision as dtp
 from pycoingecko import CoinGeckoAPI
 from google.cloud import error_reporting
 
-from TickerParser import Ticker, Exchange
+from TickerParser import Ticker, Exchange, PrecisionTable
 
 from assets import static_storage
 from helpers.utils import Utils
+from helpers.index import ParserIndex
+from helpers.markets import MarketTable
 from helpers import supported
 
 
+LRU_READY = b"\x01"
+LRU_EXIT = b"\x02"
+
 class TickerParserServer(object):
 	coinGecko = CoinGeckoAPI()
 
-	exchanges = {}
-	ccxtIndex = {}
-	coinGeckoIndex = {}
-	iexcStocksIndex = {}
-	iexcForexIndex = {}
-
-	coingeckoVsCurrencies = []
-	coingeckoFiatCurrencies = []
-
-	def __init__(self):
+	marketLoadTimes = {}
+	marketLoads = {}
+	marketLoadsLock = Lock()
+	exchangeShortcuts = {
+		"crypto": {
+			"binance": ["bin", "bi", "b"],
+			"bitmex": ["bmx", "mex", "btmx", "bx"],
+			"binancefutures": ["binancef", "fbin", "binf", "bif", "bf", "bnf"],
+			"coinbasepro": ["cbp", "coin", "base", "cb", "coinbase", "coinbasepro", "cbpro"],
+			"bitfinex2": ["bfx", "finex", "bf"],
+			"bittrex": ["btrx", "brx"],
+			"huobipro": ["hpro"],
+			"poloniex": ["po", "polo"],
+			"kraken": ["k", "kra"],
+			"gemini": ["ge", "gem"]
+		},
+		"traditional": {}
+	}
+
+	index = ParserIndex()
+	snapshotGeneration = None
+	snapshotFailed = False
+	snapshotLock = Lock()
+	snapshotPath = os.environ.get("PARSER_SNAPSHOT_PATH", "/tmp/alpha-parser-index.pickle")
+	workersAddress = os.environ.get("PARSER_WORKERS_ADDRESS", "ipc:///tmp/alpha-parser-workers")
+
+	def __init__(self, workerCount=1):
 		self.isServiceAvailable = True
 		signal.signal(signal.SIGINT, self.exit_gracefully)
 		signal.signal(signal.SIGTERM, self.exit_gracefully)
 
+		self.workerCount = workerCount
+		self.workerGeneration = None
+		self.workerEpoch = 0
+		self.spawnedWorkers = 0
+		if workerCount > 1: self.start_zygote()
+
 		self.logging = error_reporting.Client(service="parser")
 
-		TickerParserServer.refresh_coingecko_index()
-		processes = [
-			Thread(target=TickerParserServer.refresh_coingecko_exchange_rates),
-			Thread(target=TickerParserServer.refresh_ccxt_index),
-			Thread(target=TickerParserServer.refresh_iexc_index)
-		]
-		for p in processes: p.start()
-		for p in processes: p.join()
+		snapshot = TickerParserServer.load_snapshot()
+		if snapshot is None:
+			TickerParserServer.refresh_index()
+		else:
+			TickerParserServer.index = snapshot
+			Thread(target=TickerParserServer.refresh_index, args=(snapshot,), daemon=True).start()
 
-		self.jobQueue = Thread(target=self.job_queue)
+		self.jobQueue = Thread(target=self.job_queue, daemon=True)
 		self.jobQueue.start()
 
 		context = zmq.Context.instance()
@@ -60,7 +91,7 @@ class TickerParserServer(object):
 
 		print("[Startup]: Ticker Parser is online")
 
-	def exit_gracefully(self):
+	def exit_gracefully(self, signum, frame):
 		print("[Startup]: Ticker Parser is exiting")
 		self.socket.close()
 		self.isServiceAvailable = False
@@ -68,53 +99,232 @@ class TickerParserServer(object):
 	def run(self):
 		while self.isServiceAvailable:
 			try:
-				response = None
 				message = self.socket.recv_multipart()
-				if len(message) != 4: self.logging.report(str(message))
-				origin, delimeter, service, request = message
-				request = pickle.loads(zlib.decompress(request))
-
-				if service == b"find_exchange":
-					(raw, platform, bias) = request
-					response = TickerParserServer.find_exchange(raw, platform, bias)
-				elif service == b"process_known_tickers":
-					(ticker, exchange, platform, defaults, bias) = request
-					response = TickerParserServer.process_known_tickers(ticker, exchange, platform, defaults, bias)
-				elif service == b"find_ccxt_crypto_market":
-					(ticker, exchange, platform, defaults) = request
-					response = TickerParserServer.find_ccxt_crypto_market(ticker, exchange, platform, defaults)
-				elif service == b"find_coingecko_crypto_market":
-					(ticker) = request
-					response = TickerParserServer.find_coingecko_crypto_market(ticker)
-				elif service == b"find_iexc_market":
-					(ticker, exchange) = request
-					response = TickerParserServer.find_iexc_market(ticker, exchange)
-				elif service == b"find_quandl_market":
-					(ticker) = request
-					response = TickerParserServer.find_quandl_market(ticker)
-				elif service == b"get_coingecko_image":
-					(base) = request
-					response = TickerParserServer.get_coingecko_image(base)
-				elif service == b"check_if_fiat":
-					(tickerId) = request
-					response = TickerParserServer.check_if_fiat(tickerId)
-				elif service == b"get_listings":
-					(ticker) = request
-					response = TickerParserServer.get_listings(ticker)
-				elif service == b"get_formatted_price":
-					(exchange, symbol, price) = request
-					response = TickerParserServer.format_price(exchange, symbol, price)
-				elif service == b"get_formatted_amount":
-					(exchange, symbol, price) = request
-					response = TickerParserServer.format_amount(exchange, symbol, price)
-
+				if message == [LRU_EXIT]: return
+				self.respond(message)
 			except (KeyboardInterrupt, SystemExit): return
 			except Exception:
 				print(traceback.format_exc())
-				if os.environ["PRODUCTION_MODE"]: self.logging.report_exception(user=f"{request}")
-			finally:
-				try: self.socket.send_multipart([origin, delimeter, zlib.compress(pickle.dumps(response, -1))])
-				except: pass
+				if os.environ["PRODUCTION_MODE"]: self.logging.report_exception()
+
+	def respond(self, message):
+		response, request = None, None
+		try:
+			if len(message) != 4: self.logging.report(str(message))
+			origin, delimeter, service, request = message
+			request = pickle.loads(zlib.decompress(request))
+
+			response = self.process_request(service, request)
+
+		except Exception:
+			print(traceback.format_exc())
+			if os.environ["PRODUCTION_MODE"]: self.logging.report_exception(user=f"{request}")
+		finally:
+			try: self.socket.send_multipart([origin, delimeter, zlib.compress(pickle.dumps(response, -1))])
+			except: pass
+
+	def queue(self):
+		backend = zmq.Context.instance().socket(zmq.ROUTER)
+		backend.bind(TickerParserServer.workersAddress)
+
+		workerPoller = zmq.Poller()
+		workerPoller.register(backend, zmq.POLLIN)
+		workerPoller.register(self.zygoteExits, zmq.POLLIN)
+		poller = zmq.Poller()
+		poller.register(backend, zmq.POLLIN)
+		poller.register(self.zygoteExits, zmq.POLLIN)
+		poller.register(self.socket, zmq.POLLIN)
+
+		availableWorkers = []
+		workersReady = False
+		exits = b""
+		try:
+			while self.isServiceAvailable:
+				try:
+					# Workers serve the published snapshot, so every new generation gets a fresh set of workers and the previous one is retired once idle
+					if TickerParserServer.snapshotFailed and self.workerGeneration is not None:
+						# Workers can only serve what is on disk, so a failed snapshot retires them and the broker keeps serving the live index itself
+						print("[Startup]: Index snapshot failed, falling back to single process mode")
+						self.workerGeneration, self.workerEpoch, workersReady = None, self.spawnedWorkers, False
+						for workerId in availableWorkers: backend.send_multipart([workerId, LRU_EXIT])
+						availableWorkers = []
+					elif not TickerParserServer.snapshotFailed and TickerParserServer.snapshotGeneration is not None and TickerParserServer.snapshotGeneration != self.workerGeneration:
+						self.workerGeneration, self.workerEpoch, workersReady = TickerParserServer.snapshotGeneration, self.spawnedWorkers, False
+						for workerId in availableWorkers: backend.send_multipart([workerId, LRU_EXIT])
+						availableWorkers = []
+						for _ in range(self.workerCount): self.spawn_worker()
+
+					# Until a worker of the current generation reports ready, requests are answered in-process instead of waiting on the workers
+					serveInProcess = len(availableWorkers) == 0 and not workersReady
+					sockets = dict((poller if len(availableWorkers) != 0 or serveInProcess else workerPoller).poll(1000))
+
+					if self.zygoteExits in sockets:
+						data = os.read(self.zygoteExits, 4096)
+						if data == b"":
+							print("[Startup]: Worker zygote exited")
+							break
+						*exited, exits = (exits + data).split(b"\n")
+						for workerId in exited:
+							if workerId in availableWorkers: availableWorkers.remove(workerId)
+							if self.is_current_worker(workerId): self.spawn_worker()
+
+					if backend in sockets:
+						workerId, *response = backend.recv_multipart()
+						if response != [LRU_READY]: self.socket.send_multipart(response, copy=False)
+						if self.is_current_worker(workerId):
+							availableWorkers.append(workerId)
+							workersReady = True
+						else: backend.send_multipart([workerId, LRU_EXIT])
+
+					if self.socket in sockets:
+						if len(availableWorkers) != 0:
+							message = self.socket.recv_multipart()
+							backend.send_multipart([availableWorkers.pop(0)] + message)
+						elif serveInProcess:
+							self.respond(self.socket.recv_multipart())
+
+				except (KeyboardInterrupt, SystemExit): break
+				except Exception:
+					print(traceback.format_exc())
+					if os.environ["PRODUCTION_MODE"]: self.logging.report_exception()
+
+		finally:
+			os.close(self.zygoteCommands)
+			os.waitpid(self.zygote, 0)
+			backend.close()
+
+	def spawn_worker(self):
+		self.spawnedWorkers += 1
+		os.write(self.zygoteCommands, "{}-{}\n".format(self.workerGeneration, self.spawnedWorkers).encode("ascii"))
+
+	def start_zygote(self):
+		# Workers are forked from a process that is split off before the server starts any thread or client, so that a fork never copies a lock held by another thread
+		commands, self.zygoteCommands = os.pipe()
+		self.zygoteExits, exits = os.pipe()
+		self.zygote = os.fork()
+		if self.zygote != 0:
+			os.close(commands)
+			os.close(exits)
+			return
+
+		os.close(self.zygoteCommands)
+		os.close(self.zygoteExits)
+		signal.signal(signal.SIGINT, signal.SIG_IGN)
+		signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit())
+
+		workers, buffer = {}, b""
+		try:
+			while True:
+				if len(select.select([commands], [], [], 1)[0]) != 0:
+					data = os.read(commands, 4096)
+					if data == b"": break
+					*requested, buffer = (buffer + data).split(b"\n")
+					for workerId in requested:
+						pid = self.fork_worker(workerId, commands, exits)
+						if pid is None: os.write(exits, workerId + b"\n")
+						else: workers[pid] = workerId
+
+				while len(workers) != 0:
+					pid, _ = os.waitpid(-1, os.WNOHANG)
+					if pid == 0: break
+					os.write(exits, workers.pop(pid) + b"\n")
+		except (KeyboardInterrupt, SystemExit): pass
+		except Exception:
+			print(traceback.format_exc())
+		finally:
+			for pid in workers: os.kill(pid, signal.SIGTERM)
+			os._exit(0)
+
+	def fork_worker(self, workerId, commands, exits):
+		generation = int(workerId.split(b"-")[0])
+		if TickerParserServer.index.generation != generation:
+			gc.unfreeze()
+			snapshot = TickerParserServer.load_snapshot()
+			if snapshot is None: return None
+			TickerParserServer.index = snapshot
+			gc.collect()
+
+		# Objects allocated so far are moved out of the collector's reach, so that the forked worker doesn't touch the pages it shares with the index
+		gc.freeze()
+		pid = os.fork()
+		if pid != 0: return pid
+
+		try:
+			os.close(commands)
+			os.close(exits)
+			signal.signal(signal.SIGTERM, signal.SIG_DFL)
+			self.logging = error_reporting.Client(service="parser")
+			self.socket = zmq.Context.instance().socket(zmq.DEALER)
+			self.socket.identity = workerId
+			self.socket.connect(TickerParserServer.workersAddress)
+			self.socket.send(LRU_READY)
+			self.run()
+		except:
+			print(traceback.format_exc())
+		finally:
+			os._exit(0)
+
+	def is_current_worker(self, workerId):
+		# Generations follow the content, so a generation can come back and only workers spawned since the last swap count as current
+		generation, spawned = workerId.split(b"-")
+		return int(generation) == self.workerGeneration and int(spawned) > self.workerEpoch
+
+	def process_request(self, service, request, index=None):
+		# The index is read once so that a whole request is answered from a single generation even if a refresh publishes in the meantime
+		if index is None: index = TickerParserServer.index
+		if service == b"batch":
+			return self.process_batch(request, index)
+		elif service == b"get_generation":
+			return index.generation
+		elif service == b"get_precision_generation":
+			return index.precisionGeneration
+		elif service == b"get_precision_table":
+			return index.precisionGeneration, index.precisionTable
+		elif service == b"find_exchange":
+			(raw, platform, bias) = request
+			return TickerParserServer.find_exchange(index, raw, platform, bias)
+		elif service == b"process_known_tickers":
+			(ticker, exchange, platform, defaults, bias) = request
+			return TickerParserServer.process_known_tickers(index, ticker, exchange, platform, defaults, bias)
+		elif service == b"find_ccxt_crypto_market":
+			(ticker, exchange, platform, defaults) = request
+			return TickerParserServer.find_ccxt_crypto_market(index, ticker, exchange, platform, defaults)
+		elif service == b"find_coingecko_crypto_market":
+			(ticker) = request
+			return TickerParserServer.find_coingecko_crypto_market(index, ticker)
+		elif service == b"find_iexc_market":
+			(ticker, exchange) = request
+			return TickerParserServer.find_iexc_market(index, ticker, exchange)
+		elif service == b"find_quandl_market":
+			(ticker) = request
+			return TickerParserServer.find_quandl_market(index, ticker)
+		elif service == b"get_coingecko_image":
+			(base) = request
+			return TickerParserServer.get_coingecko_image(index, base)
+		elif service == b"check_if_fiat":
+			(tickerId) = request
+			return TickerParserServer.check_if_fiat(index, tickerId)
+		elif service == b"get_listings":
+			(ticker) = request
+			return TickerParserServer.get_listings(index, ticker)
+		elif service == b"get_formatted_price":
+			(exchange, symbol, price) = request
+			return TickerParserServer.format_price(index, exchange, symbol, price)
+		elif service == b"get_formatted_amount":
+			(exchange, symbol, price) = request
+			return TickerParserServer.format_amount(index, exchange, symbol, price)
+
+	def process_batch(self, requests, index):
+		responses = []
+		for service, request in requests:
+			try:
+				response = self.process_request(service, pickle.loads(request), index)
+				responses.append(pickle.dumps(response, -1))
+			except Exception:
+				print(traceback.format_exc())
+				if os.environ["PRODUCTION_MODE"]: self.logging.report_exception(user=f"{service}")
+				responses.append(None)
+		return responses
 
 	def job_queue(self):
 		while True:
@@ -123,19 +333,75 @@ class TickerParserServer(object):
 				t = datetime.datetime.now().astimezone(pytz.utc)
 				timeframes = Utils.get_accepted_timeframes(t)
 
-				if "1h" in timeframes:
-					TickerParserServer.refresh_ccxt_index()
-					TickerParserServer.refresh_coingecko_index()
-					TickerParserServer.refresh_coingecko_exchange_rates()
-				if "1D" in timeframes:
-					TickerParserServer.refresh_iexc_index()
+				if "1h" in timeframes or "1D" in timeframes:
+					TickerParserServer.refresh_index(TickerParserServer.index, hourly="1h" in timeframes, daily="1D" in timeframes)
 
 			except Exception:
 				print(traceback.format_exc())
 				if os.environ["PRODUCTION_MODE"]: self.logging.report_exception()
 
 	@staticmethod
-	def refresh_ccxt_index():
+	def refresh_index(previous=None, hourly=True, daily=True):
+		index = ParserIndex(previous)
+		if hourly: TickerParserServer.refresh_coingecko_index(index)
+
+		processes = []
+		if hourly:
+			processes.append(Thread(target=TickerParserServer.refresh_coingecko_exchange_rates, args=(index,)))
+			processes.append(Thread(target=TickerParserServer.refresh_ccxt_index, args=(index,)))
+		if daily:
+			processes.append(Thread(target=TickerParserServer.refresh_iexc_index, args=(index,)))
+		for p in processes: p.start()
+		for p in processes: p.join()
+
+		TickerParserServer.refresh_exchange_aliases(index)
+		index.precisionTable = PrecisionTable.build(index.exchanges.values(), index.precisionTable)
+		TickerParserServer.publish(index)
+
+	@staticmethod
+	def publish(index):
+		# Requests read TickerParserServer.index once, so swapping the reference publishes a complete generation atomically
+		index.seal()
+		TickerParserServer.index = index
+		Thread(target=TickerParserServer.save_snapshot, args=(index,), daemon=True).start()
+
+	@staticmethod
+	def save_snapshot(index):
+		# Saves are serialized and each writes its own temporary file, so overlapping refreshes can neither interleave writes nor replace a newer snapshot with an older one
+		with TickerParserServer.snapshotLock:
+			if TickerParserServer.index is not index: return
+			snapshot = None
+			try:
+				snapshotDirectory, snapshotName = os.path.split(os.path.abspath(TickerParserServer.snapshotPath))
+				with tempfile.NamedTemporaryFile(dir=snapshotDirectory, prefix=snapshotName + ".", suffix=".tmp", delete=False) as snapshot:
+					pickle.dump(index, snapshot, -1)
+				os.replace(snapshot.name, TickerParserServer.snapshotPath)
+				TickerParserServer.snapshotGeneration, TickerParserServer.snapshotFailed = index.generation, False
+			except Exception:
+				TickerParserServer.snapshotFailed = True
+				print(traceback.format_exc())
+				if snapshot is not None and os.path.exists(snapshot.name): os.remove(snapshot.name)
+
+	@staticmethod
+	def load_snapshot():
+		try:
+			startTime = time.time()
+			with open(TickerParserServer.snapshotPath, "rb") as snapshot:
+				index = pickle.load(snapshot)
+			if not isinstance(index, ParserIndex) or not set(vars(ParserIndex())).issubset(vars(index)):
+				print("[Startup]: Discarding index snapshot with an outdated layout")
+				return None
+			TickerParserServer.snapshotGeneration = index.generation
+			print("[Startup]: Loaded index snapshot of generation {} in {:.2f} seconds".format(index.generation, time.time() - startTime))
+			return index
+		except FileNotFoundError:
+			return None
+		except Exception:
+			print(traceback.format_exc())
+			return None
+
+	@staticmethod
+	def refresh_ccxt_index(index):
 		difference = set(ccxt.exchanges).symmetric_difference(supported.ccxtExchanges)
 		newExchanges = []
 		newSupportedExchanges = []
@@ -153,25 +419,21 @@ class TickerParserServer(object):
 		if len(newExchanges) != 0: print("New partially unsupported CCXT exchanges: {}".format(newExchanges))
 		if len(unsupportedCryptoExchanges) != 0: print("New deprecated CCXT exchanges: {}".format(unsupportedCryptoExchanges))
 
-		completedTasks = set()
+		completedTasks = TickerParserServer.load_exchange_markets(index, {exchange for platform in supported.cryptoExchanges for exchange in supported.cryptoExchanges[platform]})
 		sortedIndexReference = {}
 
 		for platform in supported.cryptoExchanges:
 			if platform not in sortedIndexReference: sortedIndexReference[platform] = {}
 			for exchange in supported.cryptoExchanges[platform]:
-				if exchange not in completedTasks:
-					if exchange not in TickerParserServer.exchanges: TickerParserServer.exchanges[exchange] = Exchange(exchange, "crypto" if exchange in ccxt.exchanges else "traditional")
-					try: TickerParserServer.exchanges[exchange].properties.load_markets()
-					except: continue
-					completedTasks.add(exchange)
-
-				for symbol in TickerParserServer.exchanges[exchange].properties.symbols:
-					if '.' not in symbol and ("active" not in TickerParserServer.exchanges[exchange].properties.markets[symbol] or TickerParserServer.exchanges[exchange].properties.markets[symbol]["active"] is None or TickerParserServer.exchanges[exchange].properties.markets[symbol]["active"]):
-						base = TickerParserServer.exchanges[exchange].properties.markets[symbol]["base"]
-						quote = TickerParserServer.exchanges[exchange].properties.markets[symbol]["quote"]
+				if exchange not in completedTasks: continue
+
+				for market in index.markets[exchange].markets.values():
+					symbol = market.symbol
+					if '.' not in symbol and (market.active is None or market.active):
+						base, quote = market.base, market.quote
 						marketPair = symbol.split("/")
 
-						isIdentifiable = quote in TickerParserServer.coinGeckoIndex and TickerParserServer.coinGeckoIndex[quote]["market_cap_rank"] is not None
+						isIdentifiable = quote in index.coinGeckoIndex and index.coinGeckoIndex[quote]["market_cap_rank"] is not None
 
 						if base != marketPair[0] or quote != marketPair[-1]:
 							if marketPair[0] != marketPair[-1]: base, quote = marketPair[0], marketPair[-1]
@@ -180,26 +442,156 @@ class TickerParserServer(object):
 							sortedIndexReference[platform][base] = {}
 						if quote not in sortedIndexReference[platform][base]:
 							if isIdentifiable:
-								sortedIndexReference[platform][base][quote] = TickerParserServer.coinGeckoIndex[quote]["market_cap_rank"]
+								sortedIndexReference[platform][base][quote] = index.coinGeckoIndex[quote]["market_cap_rank"]
 							else:
 								sortedIndexReference[platform][base][quote] = sys.maxsize
 
+		ccxtIndex = dict(index.ccxtIndex)
 		for platform in sortedIndexReference:
-			TickerParserServer.ccxtIndex[platform] = {}
+			ccxtIndex[platform] = {}
 			for base in sortedIndexReference[platform]:
-				if base not in TickerParserServer.ccxtIndex[platform]: TickerParserServer.ccxtIndex[platform][base] = []
-				TickerParserServer.ccxtIndex[platform][base] = sorted(sortedIndexReference[platform][base].keys(), key=lambda quote: sortedIndexReference[platform][base][quote])
-				# try: TickerParserServer.ccxtIndex[platform][base].insert(1 if TickerParserServer.ccxtIndex[platform][base][0] == "BTC" and base not in ["ETH", "XRP", "BCH", "LTC"] else 0, TickerParserServer.ccxtIndex[platform][base].pop(TickerParserServer.ccxtIndex[platform][base].index("USDT")))
+				if base not in ccxtIndex[platform]: ccxtIndex[platform][base] = []
+				ccxtIndex[platform][base] = sorted(sortedIndexReference[platform][base].keys(), key=lambda quote: sortedIndexReference[platform][base][quote])
+				# try: ccxtIndex[platform][base].insert(1 if ccxtIndex[platform][base][0] == "BTC" and base not in ["ETH", "XRP", "BCH", "LTC"] else 0, ccxtIndex[platform][base].pop(ccxtIndex[platform][base].index("USDT")))
 				# except: pass
-				# try: TickerParserServer.ccxtIndex[platform][base].insert(1 if TickerParserServer.ccxtIndex[platform][base][0] == "BTC" and base not in ["ETH", "XRP", "BCH", "LTC"] else 0, TickerParserServer.ccxtIndex[platform][base].pop(TickerParserServer.ccxtIndex[platform][base].index("USD")))
+				# try: ccxtIndex[platform][base].insert(1 if ccxtIndex[platform][base][0] == "BTC" and base not in ["ETH", "XRP", "BCH", "LTC"] else 0, ccxtIndex[platform][base].pop(ccxtIndex[platform][base].index("USD")))
 				# except: pass
-				try: TickerParserServer.ccxtIndex[platform][base].insert(0, TickerParserServer.ccxtIndex[platform][base].pop(TickerParserServer.ccxtIndex[platform][base].index("USDT")))
+				try: ccxtIndex[platform][base].insert(0, ccxtIndex[platform][base].pop(ccxtIndex[platform][base].index("USDT")))
 				except: pass
-				try: TickerParserServer.ccxtIndex[platform][base].insert(0, TickerParserServer.ccxtIndex[platform][base].pop(TickerParserServer.ccxtIndex[platform][base].index("USD")))
+				try: ccxtIndex[platform][base].insert(0, ccxtIndex[platform][base].pop(ccxtIndex[platform][base].index("USD")))
 				except: pass
+		index.ccxtIndex = ccxtIndex
+
+		ccxtMarketCandidates, ccxtMarketIndex = {}, {}
+		for exchangeId, markets in index.markets.items():
+			if index.exchanges[exchangeId].type == "crypto":
+				ccxtMarketCandidates[exchangeId], ccxtMarketIndex[exchangeId] = TickerParserServer.build_ccxt_market_index(markets)
+		index.ccxtMarketCandidates, index.ccxtMarketIndex = ccxtMarketCandidates, ccxtMarketIndex
+		index.listingsIndex = TickerParserServer.build_listings_index(index)
+
+	@staticmethod
+	def build_listings_index(index):
+		listingsIndex = {}
+		for id in supported.cryptoExchanges["CCXT"]:
+			if id in index.markets:
+				for market in index.markets[id].markets.values():
+					base, quote = market.base, market.quote
+					if base not in listingsIndex: listingsIndex[base] = {"quotes": {}, "ranked": [], "total": 0}
+					if quote not in listingsIndex[base]["quotes"]: listingsIndex[base]["quotes"][quote] = []
+					if index.exchanges[id].name not in listingsIndex[base]["quotes"][quote]:
+						listingsIndex[base]["quotes"][quote].append(index.exchanges[id].name)
+						listingsIndex[base]["total"] += 1
+
+		for base in listingsIndex:
+			listingsIndex[base]["ranked"] = [quote for quote in index.ccxtIndex["CCXT"].get(base, []) if quote in listingsIndex[base]["quotes"]]
+
+		return listingsIndex
+
+	@staticmethod
+	def load_exchange_markets(index, exchangeIds, timeout=60, deadline=300, workers=16):
+		# Markets are loaded into fresh instances which replace the registered ones only on success, so failing exchanges keep serving their previous markets
+		startedAt, loadTimes = {}, {}
+
+		def load(exchangeId):
+			startedAt[exchangeId] = time.time()
+			exchange = Exchange(exchangeId, "crypto" if exchangeId in ccxt.exchanges else "traditional")
+			if hasattr(exchange.properties, "timeout"): exchange.properties.timeout = timeout * 1000
+			exchange.properties.load_markets()
+			markets = MarketTable(exchange)
+			markets.compact(exchange)
+			return exchange, markets
+
+		completedTasks = set()
+		for exchangeId in exchangeIds:
+			if exchangeId not in index.exchanges: index.exchanges[exchangeId] = Exchange(exchangeId, "crypto" if exchangeId in ccxt.exchanges else "traditional")
+			elif exchangeId in index.markets and len(index.markets[exchangeId].symbols) != 0:
+				completedTasks.add(exchangeId)
+
+		# Loads run on daemon threads that outlive a timed out refresh, so an exchange is only submitted again once its previous load finished
+		slots, tasks, busy = Semaphore(workers), {}, []
+		for exchangeId in exchangeIds:
+			# Exchanges restored from a snapshot come without their client and are loaded like any other
+			properties = index.exchanges[exchangeId].properties
+			if properties is not None and not hasattr(properties, "load_markets"): continue
+			with TickerParserServer.marketLoadsLock:
+				if exchangeId in TickerParserServer.marketLoads:
+					busy.append(exchangeId)
+					continue
+				task = TickerParserServer.marketLoads[exchangeId] = Future()
+			tasks[task] = exchangeId
+			Thread(target=TickerParserServer.run_market_load, args=(task, exchangeId, load, slots), daemon=True).start()
+		pending, failed = set(tasks), []
+		startTime = time.time()
+
+		while len(pending) != 0:
+			done, pending = wait(pending, timeout=1, return_when=FIRST_COMPLETED)
+			for task in done:
+				exchangeId = tasks[task]
+				try:
+					index.exchanges[exchangeId], index.markets[exchangeId] = task.result()
+					completedTasks.add(exchangeId)
+					loadTimes[exchangeId] = time.time() - startedAt[exchangeId]
+				except:
+					failed.append(exchangeId)
+
+			for task in list(pending):
+				exchangeId = tasks[task]
+				if time.time() > startTime + deadline or (exchangeId in startedAt and time.time() - startedAt[exchangeId] > timeout):
+					task.cancel()
+					pending.remove(task)
+					failed.append(exchangeId)
+
+		TickerParserServer.marketLoadTimes = loadTimes
+		slowest = sorted(loadTimes.items(), key=lambda e: e[1], reverse=True)[:5]
+		print("[Startup]: Loaded markets for {} exchanges in {:.1f} seconds, slowest: {}".format(len(loadTimes), time.time() - startTime, ", ".join(["{} ({:.1f}s)".format(exchangeId, loadTime) for exchangeId, loadTime in slowest])))
+		if len(failed) != 0: print("[Startup]: Failed to load markets for {}, falling back to previous markets".format(", ".join(sorted(failed))))
+		if len(busy) != 0: print("[Startup]: Previous market loads for {} are still running, keeping previous markets".format(", ".join(sorted(busy))))
+
+		return completedTasks
+
+	@staticmethod
+	def run_market_load(task, exchangeId, load, slots):
+		try:
+			with slots:
+				if not task.set_running_or_notify_cancel(): return
+				try: task.set_result(load(exchangeId))
+				except Exception as exception: task.set_exception(exception)
+		finally:
+			with TickerParserServer.marketLoadsLock:
+				if TickerParserServer.marketLoads.get(exchangeId) is task: TickerParserServer.marketLoads.pop(exchangeId)
 
 	@staticmethod
-	def refresh_coingecko_index():
+	def build_ccxt_market_index(markets):
+		# Maps every name a market can be looked up by (the full pair name in either orientation and its prefixes of at least half its length) to positions in a single list of candidate markets
+		candidates, index = [], {}
+		for i, symbol in enumerate(markets.symbols):
+			market = markets.markets[symbol]
+			if not market.active: continue
+
+			base, quote = market.base, market.quote
+			rankBase = base
+			marketPair = symbol.split("/")
+			marketPairName = market.name
+			fit = 2 if len(marketPair) == 1 else 1
+			pairBase, pairQuote = (None, None) if fit == 2 else (marketPair[0], marketPair[1])
+
+			for isReversed in [False, True]:
+				if isReversed:
+					marketPair.reverse()
+					base, quote, marketPairName = quote, base, "".join(marketPair)
+
+				candidates.append((i * 2 + isReversed, fit, isReversed, marketPairName, base, quote, symbol, pairBase, pairQuote, rankBase))
+				keys = {marketPair[0] if fit == 2 else marketPair[0] + marketPair[1]}
+				for length in range((len(marketPairName) + 1) // 2, len(marketPairName) + 1):
+					keys.add(marketPairName[:length])
+				for key in keys:
+					if key not in index: index[key] = array("I")
+					index[key].append(len(candidates) - 1)
+
+		return candidates, index
+
+	@staticmethod
+	def refresh_coingecko_index(index):
 		try:
 			blacklist = ["UNIUSD", "AAPL", "TSLA"]
 			rawData = []
@@ -227,39 +619,52 @@ class TickerParserServer(object):
 						adjustedSymbol = "{}:{}".format(symbol, i)
 						if adjustedSymbol not in indexReference:
 							indexReference[adjustedSymbol] = {"id": e["id"], "name": e["name"], "base": adjustedSymbol, "quote": "USD", "image": e["image"], "market_cap_rank": e["market_cap_rank"]}
-			TickerParserServer.coinGeckoIndex = indexReference
+
+			positions, prefixIndex = {}, {}
+			for position, base in enumerate(indexReference):
+				positions[base] = position
+				for length in range(len(base) + 1):
+					if base[:length] not in prefixIndex: prefixIndex[base[:length]] = base
+
+			index.coinGeckoIndex = indexReference
+			index.coinGeckoPositions = positions
+			index.coinGeckoPrefixIndex = prefixIndex
+			index.coinGeckoSortedIndex = sorted(indexReference)
 
 		except Exception:
 			print(traceback.format_exc())
 
 	@staticmethod
-	def refresh_coingecko_exchange_rates():
+	def refresh_coingecko_exchange_rates(index):
 		try:
 			coingeckoVsCurrencies = TickerParserServer.coinGecko.get_supported_vs_currencies()
-			TickerParserServer.coingeckoVsCurrencies = [e.upper() for e in coingeckoVsCurrencies]
+			coingeckoFiatCurrencies = []
 			exchangeRates = TickerParserServer.coinGecko.get_exchange_rates()
 			for ticker, value in exchangeRates["rates"].items():
 				if value["type"] == "fiat":
-					TickerParserServer.coingeckoFiatCurrencies.append(ticker.upper())
+					coingeckoFiatCurrencies.append(ticker.upper())
+			index.coingeckoVsCurrencies = [e.upper() for e in coingeckoVsCurrencies]
+			index.coingeckoFiatCurrencies = coingeckoFiatCurrencies
 		except Exception:
 			print(traceback.format_exc())
 
 	@staticmethod
-	def refresh_iexc_index():
+	def refresh_iexc_index(index):
 		try:
-			iexcExchanges = set()
+			iexcExchanges, registry = set(), {}
+			iexcStocksIndex, iexcForexIndex = {}, {}
 			exchanges = requests.get("https://cloud.iexapis.com/stable/ref-data/market/us/exchanges?token={}".format(os.environ["IEXC_KEY"])).json()
 			for exchange in exchanges:
 				if exchange["refId"] == "": continue
 				exchangeId = exchange["refId"]
 				iexcExchanges.add(exchangeId.lower())
-				TickerParserServer.exchanges[exchangeId.lower()] = Exchange(exchangeId, "traditional", exchange["longName"], region="us")
+				registry[exchangeId.lower()] = Exchange(exchangeId, "traditional", exchange["longName"], region="us")
 			exchanges = requests.get("https://cloud.iexapis.com/stable/ref-data/exchanges?token={}".format(os.environ["IEXC_KEY"])).json()
 			for exchange in exchanges:
 				exchangeId = exchange["exchange"]
 				if exchangeId.lower() in iexcExchanges: continue
 				iexcExchanges.add(exchangeId.lower())
-				TickerParserServer.exchanges[exchangeId.lower()] = Exchange(exchangeId, "traditional", exchange["description"], region=exchange["region"])
+				registry[exchangeId.lower()] = Exchange(exchangeId, "traditional", exchange["description"], region=exchange["region"])
 			
 			difference = set(iexcExchanges).symmetric_difference(supported.iexcExchanges)
 			newSupportedExchanges = []
@@ -273,126 +678,90 @@ class TickerParserServer(object):
 			if len(unsupportedCryptoExchanges) != 0: print("New deprecated IEXC exchanges: {}".format(unsupportedCryptoExchanges))
 
 			for exchangeId in supported.traditionalExchanges["IEXC"]:
-				symbols = requests.get("https://cloud.iexapis.com/stable/ref-data/exchange/{}/symbols?token={}".format(TickerParserServer.exchanges[exchangeId].id, os.environ["IEXC_KEY"])).json()
+				symbols = requests.get("https://cloud.iexapis.com/stable/ref-data/exchange/{}/symbols?token={}".format(registry[exchangeId].id, os.environ["IEXC_KEY"])).json()
 				if len(symbols) == 0: print("No symbols found on {}".format(exchangeId))
 				for symbol in symbols:
 					tickerId = symbol["symbol"]
-					if tickerId not in TickerParserServer.iexcStocksIndex:
-						TickerParserServer.iexcStocksIndex[tickerId] = {"id": tickerId, "name": symbol["name"], "base": tickerId, "quote": symbol["currency"], "exchange": exchangeId}
-					TickerParserServer.exchanges[exchangeId].properties.symbols.append(tickerId)
+					if tickerId not in iexcStocksIndex:
+						iexcStocksIndex[tickerId] = {"id": tickerId, "name": symbol["name"], "base": tickerId, "quote": symbol["currency"], "exchange": exchangeId}
+					registry[exchangeId].properties.symbols.append(tickerId)
 			
 			forexSymbols = requests.get("https://cloud.iexapis.com/stable/ref-data/fx/symbols?token={}".format(os.environ["IEXC_KEY"])).json()
 			derivedCurrencies = set()
 			for pair in forexSymbols["pairs"]:
 				derivedCurrencies.add(pair["fromCurrency"])
 				derivedCurrencies.add(pair["toCurrency"])
-				TickerParserServer.iexcForexIndex[pair["symbol"]] = {"id": pair["symbol"], "name": pair["symbol"], "base": pair["fromCurrency"], "quote": pair["toCurrency"], "reversed": False}
-				TickerParserServer.iexcForexIndex[pair["toCurrency"] + pair["fromCurrency"]] = {"id": pair["symbol"], "name": pair["toCurrency"] + pair["fromCurrency"], "base": pair["toCurrency"], "quote": pair["fromCurrency"], "reversed": True}
+				iexcForexIndex[pair["symbol"]] = {"id": pair["symbol"], "name": pair["symbol"], "base": pair["fromCurrency"], "quote": pair["toCurrency"], "reversed": False}
+				iexcForexIndex[pair["toCurrency"] + pair["fromCurrency"]] = {"id": pair["symbol"], "name": pair["toCurrency"] + pair["fromCurrency"], "base": pair["toCurrency"], "quote": pair["fromCurrency"], "reversed": True}
 			for fromCurrency in derivedCurrencies:
 				for toCurrency in derivedCurrencies:
 					symbol = fromCurrency + toCurrency
-					if fromCurrency != toCurrency and symbol not in TickerParserServer.iexcForexIndex:
-						TickerParserServer.iexcForexIndex[symbol] = {"id": symbol, "name": symbol, "base": fromCurrency, "quote": toCurrency, "reversed": False}
+					if fromCurrency != toCurrency and symbol not in iexcForexIndex:
+						iexcForexIndex[symbol] = {"id": symbol, "name": symbol, "base": fromCurrency, "quote": toCurrency, "reversed": False}
+
+			index.exchanges.update(registry)
+			index.iexcStocksIndex = iexcStocksIndex
+			index.iexcForexIndex = iexcForexIndex
 
 		except Exception:
 			print(traceback.format_exc())
 
 	@staticmethod
-	def find_exchange(raw, platform, bias):
+	def refresh_exchange_aliases(index):
+		exchangeAliases, exchangeFallbackAliases = {}, {}
+		for bias, platforms in [("crypto", supported.cryptoExchanges), ("traditional", supported.traditionalExchanges)]:
+			exchangeAliases[bias], exchangeFallbackAliases[bias] = {}, {}
+			for platform in platforms:
+				exchangeAliases[bias][platform] = {}
+				for exchangeId in platforms[platform]:
+					shortcuts, aliases, minimumLength = TickerParserServer.generate_exchange_aliases(index, exchangeId, bias)
+					for alias in shortcuts:
+						exchangeAliases[bias][platform].setdefault(alias, exchangeId)
+						exchangeFallbackAliases[bias].setdefault(alias, exchangeId)
+					for alias in aliases:
+						if len(alias) >= minimumLength: exchangeAliases[bias][platform].setdefault(alias, exchangeId)
+						exchangeFallbackAliases[bias].setdefault(alias, exchangeId)
+
+		index.exchangeAliases = exchangeAliases
+		index.exchangeFallbackAliases = exchangeFallbackAliases
+
+	@staticmethod
+	def generate_exchange_aliases(index, exchangeId, bias):
+		if exchangeId in index.exchanges and index.exchanges[exchangeId].name is not None:
+			name = index.exchanges[exchangeId].name.split(" ")[0].lower()
+			nameNoSpaces = index.exchanges[exchangeId].name.replace(" ", "").lower()
+		else:
+			name, nameNoSpaces = exchangeId, exchangeId
+
+		aliases = set()
+		for alias in [name, nameNoSpaces, exchangeId]:
+			for length in range(len(alias) + 1):
+				aliases.add(alias[:length])
+				aliases.add(alias[length:])
+
+		# Name matches within the requested platform need to cover at least a third of the name
+		return TickerParserServer.exchangeShortcuts[bias].get(exchangeId, []), aliases, len(name) * 0.33
+
+	@staticmethod
+	def find_exchange(index, raw, platform, bias):
 		if platform not in supported.cryptoExchanges and platform not in supported.traditionalExchanges: return None, None
 		if raw in ["pro"]: return None, None
 
-		shortcuts = {
-			"crypto": {
-				"binance": ["bin", "bi", "b"],
-				"bitmex": ["bmx", "mex", "btmx", "bx"],
-				"binancefutures": ["binancef", "fbin", "binf", "bif", "bf", "bnf"],
-				"coinbasepro": ["cbp", "coin", "base", "cb", "coinbase", "coinbasepro", "cbpro"],
-				"bitfinex2": ["bfx", "finex", "bf"],
-				"bittrex": ["btrx", "brx"],
-				"huobipro": ["hpro"],
-				"poloniex": ["po", "polo"],
-				"kraken": ["k", "kra"],
-				"gemini": ["ge", "gem"]
-			},
-			"traditional": {}
-		}
-
 		if platform in ["TradingLite", "Bookmap", "GoCharting", "LLD", "CoinGecko", "CCXT", "Ichibot"]:
 			bias = "crypto"
 		elif platform in ["IEXC", "Quandl"]:
 			bias = "traditional"
+		if bias != "crypto": bias = "traditional"
 
-		if bias == "crypto":
-			for exchangeId in supported.cryptoExchanges[platform]:
-				if exchangeId in shortcuts["crypto"] and raw in shortcuts["crypto"][exchangeId]:
-					return True, TickerParserServer.exchanges[exchangeId]
-				if exchangeId in TickerParserServer.exchanges and TickerParserServer.exchanges[exchangeId].name is not None:
-					name = TickerParserServer.exchanges[exchangeId].name.split(" ")[0].lower()
-					nameNoSpaces = TickerParserServer.exchanges[exchangeId].name.replace(" ", "").lower()
-				else:
-					name, nameNoSpaces = exchangeId, exchangeId
-
-				if len(name) * 0.33 > len(raw): continue
-
-				if name.startswith(raw) or name.endswith(raw):
-					return True, TickerParserServer.exchanges[exchangeId]
-				elif nameNoSpaces.startswith(raw) or nameNoSpaces.endswith(raw):
-					return True, TickerParserServer.exchanges[exchangeId]
-				elif exchangeId.startswith(raw) or exchangeId.endswith(raw):
-					return True, TickerParserServer.exchanges[exchangeId]
-
-			for platform in supported.cryptoExchanges:
-				for exchangeId in supported.cryptoExchanges[platform]:
-					if exchangeId in shortcuts["crypto"] and raw in shortcuts["crypto"][exchangeId]:
-						return False, TickerParserServer.exchanges[exchangeId]
-					if exchangeId in TickerParserServer.exchanges and TickerParserServer.exchanges[exchangeId].name is not None:
-						name = TickerParserServer.exchanges[exchangeId].name.split(" ")[0].lower()
-						nameNoSpaces = TickerParserServer.exchanges[exchangeId].name.replace(" ", "").lower()
-					else:
-						name, nameNoSpaces = exchangeId, exchangeId
-
-					if name.startswith(raw) or name.endswith(raw): return False, TickerParserServer.exchanges[exchangeId]
-					elif nameNoSpaces.startswith(raw) or nameNoSpaces.endswith(raw): return False, TickerParserServer.exchanges[exchangeId]
-					elif exchangeId.startswith(raw) or exchangeId.endswith(raw): return False, TickerParserServer.exchanges[exchangeId]
-
-		else:
-			for exchangeId in supported.traditionalExchanges[platform]:
-				if exchangeId in shortcuts["traditional"] and raw in shortcuts["traditional"][exchangeId]:
-					return True, TickerParserServer.exchanges[exchangeId]
-				if exchangeId in TickerParserServer.exchanges and TickerParserServer.exchanges[exchangeId].name is not None:
-					name = TickerParserServer.exchanges[exchangeId].name.split(" ")[0].lower()
-					nameNoSpaces = TickerParserServer.exchanges[exchangeId].name.replace(" ", "").lower()
-				else:
-					name, nameNoSpaces = exchangeId, exchangeId
-
-				if len(name) * 0.33 > len(raw): continue
-
-				if name.startswith(raw) or name.endswith(raw):
-					return True, TickerParserServer.exchanges[exchangeId]
-				elif nameNoSpaces.startswith(raw) or nameNoSpaces.endswith(raw):
-					return True, TickerParserServer.exchanges[exchangeId]
-				elif exchangeId.startswith(raw) or exchangeId.endswith(raw):
-					return True, TickerParserServer.exchanges[exchangeId]
-
-			for platform in supported.traditionalExchanges:
-				for exchangeId in supported.traditionalExchanges[platform]:
-					if exchangeId in shortcuts["traditional"] and raw in shortcuts["traditional"][exchangeId]:
-						return False, TickerParserServer.exchanges[exchangeId]
-					if exchangeId in TickerParserServer.exchanges and TickerParserServer.exchanges[exchangeId].name is not None:
-						name = TickerParserServer.exchanges[exchangeId].name.split(" ")[0].lower()
-						nameNoSpaces = TickerParserServer.exchanges[exchangeId].name.replace(" ", "").lower()
-					else:
-						name, nameNoSpaces = exchangeId, exchangeId
-
-					if name.startswith(raw) or name.endswith(raw): return False, TickerParserServer.exchanges[exchangeId]
-					elif nameNoSpaces.startswith(raw) or nameNoSpaces.endswith(raw): return False, TickerParserServer.exchanges[exchangeId]
-					elif exchangeId.startswith(raw) or exchangeId.endswith(raw): return False, TickerParserServer.exchanges[exchangeId]
+		exchangeId = index.exchangeAliases[bias][platform].get(raw)
+		if exchangeId is not None: return True, index.exchanges[exchangeId]
+		exchangeId = index.exchangeFallbackAliases[bias].get(raw)
+		if exchangeId is not None: return False, index.exchanges[exchangeId]
 
 		return None, None
 
 	@staticmethod
-	def process_known_tickers(ticker, exchange, platform, defaults, bias):
+	def process_known_tickers(index, ticker, exchange, platform, defaults, bias):
 		if (ticker.id.startswith("'") and ticker.id.endswith("'")) or (ticker.id.startswith('"') and ticker.id.endswith('"')) or (ticker.id.startswith("‘") and ticker.id.endswith("’")) or (ticker.id.startswith("“") and ticker.id.endswith("”")):
 			ticker = Ticker(ticker.id[1:-1], ticker.id[1:-1], ticker.id[1:-1], "", ticker.id[1:-1], hasParts=False)
 		else:
@@ -407,10 +776,10 @@ class TickerParserServer(object):
 			}
 			cryptoTickerOverrides = {
 				"TradingLite": [
-					(Ticker("BTCUSD", "XBTUSD", "BTC", "USD", "BTC/USD", hasParts=False, mcapRank=1), TickerParserServer.exchanges["bitmex"], ["XBT", "XBTUSD"])
+					(Ticker("BTCUSD", "XBTUSD", "BTC", "USD", "BTC/USD", hasParts=False, mcapRank=1), index.exchanges["bitmex"], ["XBT", "XBTUSD"])
 				],
 				"TradingView": [
-					(Ticker("BTCUSD", "XBTUSD", "BTC", "USD", "BTC/USD", hasParts=False, mcapRank=1), TickerParserServer.exchanges["bitmex"], ["XBT", "XBTUSD"]),
+					(Ticker("BTCUSD", "XBTUSD", "BTC", "USD", "BTC/USD", hasParts=False, mcapRank=1), index.exchanges["bitmex"], ["XBT", "XBTUSD"]),
 					(Ticker("(DJ:DJI)", "DJI", "DJI", "", "DJI", hasParts=False), None, ["DJI"]),
 					(Ticker("SPX500USD", "SPX500USD", "SPX500USD", "", "SPX500USD", hasParts=False), None, ["SPX", "SP500"]),
 					(Ticker("(BNC:BLX)", "BLX", "BTC", "USD", "BTC/USD", hasParts=False), None, ["BNC", "BLX"]),
@@ -420,22 +789,22 @@ class TickerParserServer(object):
 					(Ticker("(BTCUSDSHORTS/(BTCUSDLONGS+BTCUSDSHORTS))", "BTCUSD Shorts/Longs", None, "%", None), None, ["SL", "SHORTS/LONGS"])
 				],
 				"Bookmap": [
-					(Ticker("BTCUSD", "XBTUSD", "BTC", "USD", "BTC/USD", hasParts=False, mcapRank=1), TickerParserServer.exchanges["bitmex"], ["XBT", "XBTUSD"])
+					(Ticker("BTCUSD", "XBTUSD", "BTC", "USD", "BTC/USD", hasParts=False, mcapRank=1), index.exchanges["bitmex"], ["XBT", "XBTUSD"])
 				],
 				"GoCharting": [
-					(Ticker("BTCUSD", "XBTUSD", "BTC", "USD", "BTC/USD", hasParts=False, mcapRank=1), TickerParserServer.exchanges["bitmex"], ["XBT", "XBTUSD"])
+					(Ticker("BTCUSD", "XBTUSD", "BTC", "USD", "BTC/USD", hasParts=False, mcapRank=1), index.exchanges["bitmex"], ["XBT", "XBTUSD"])
 				],
 				"CoinGecko": [
-					(Ticker("BTCUSD", "XBTUSD", "BTC", "USD", "BTC/USD", hasParts=False, mcapRank=1), TickerParserServer.exchanges["bitmex"], ["XBT", "XBTUSD"])
+					(Ticker("BTCUSD", "XBTUSD", "BTC", "USD", "BTC/USD", hasParts=False, mcapRank=1), index.exchanges["bitmex"], ["XBT", "XBTUSD"])
 				],
 				"LLD": [
-					(Ticker("BTCUSD", "XBTUSD", "BTC", "USD", "BTC/USD", hasParts=False, mcapRank=1), TickerParserServer.exchanges["bitmex"], ["XBT", "XBTUSD"])
+					(Ticker("BTCUSD", "XBTUSD", "BTC", "USD", "BTC/USD", hasParts=False, mcapRank=1), index.exchanges["bitmex"], ["XBT", "XBTUSD"])
 				],
 				"CCXT": [
-					(Ticker("BTCUSD", "XBTUSD", "BTC", "USD", "BTC/USD", hasParts=False, mcapRank=1), TickerParserServer.exchanges["bitmex"], ["XBT", "XBTUSD"])
+					(Ticker("BTCUSD", "XBTUSD", "BTC", "USD", "BTC/USD", hasParts=False, mcapRank=1), index.exchanges["bitmex"], ["XBT", "XBTUSD"])
 				],
 				"Ichibot": [
-					(Ticker("BTCUSD", "XBTUSD", "BTC", "USD", "BTC/USD", hasParts=False, mcapRank=1), TickerParserServer.exchanges["bitmex"], ["XBT", "XBTUSD"])
+					(Ticker("BTCUSD", "XBTUSD", "BTC", "USD", "BTC/USD", hasParts=False, mcapRank=1), index.exchanges["bitmex"], ["XBT", "XBTUSD"])
 				]
 			}
 
@@ -454,8 +823,8 @@ class TickerParserServer(object):
 						if exchangeOverride is not None: exchange = exchangeOverride
 						break
 
-				if platform == "CoinGecko" and defaults["exchange"] is None and exchange is None: parsedTicker, parsedExchange = TickerParserServer.find_coingecko_crypto_market(ticker)
-				else: parsedTicker, parsedExchange = TickerParserServer.find_ccxt_crypto_market(ticker, exchange, platform, defaults)
+				if platform == "CoinGecko" and defaults["exchange"] is None and exchange is None: parsedTicker, parsedExchange = TickerParserServer.find_coingecko_crypto_market(index, ticker)
+				else: parsedTicker, parsedExchange = TickerParserServer.find_ccxt_crypto_market(index, ticker, exchange, platform, defaults)
 			else:
 				for tickerOverride, exchangeOverride, triggers in tickerOverrides.get(platform, []):
 					if ticker.id in triggers:
@@ -463,70 +832,57 @@ class TickerParserServer(object):
 						if exchangeOverride is not None: exchange = exchangeOverride
 						break
 
-				if platform == "IEXC": parsedTicker, parsedExchange = TickerParserServer.find_iexc_market(ticker, exchange)
-				elif platform == "Quandl": parsedTicker, parsedExchange = TickerParserServer.find_quandl_market(ticker)
+				if platform == "IEXC": parsedTicker, parsedExchange = TickerParserServer.find_iexc_market(index, ticker, exchange)
+				elif platform == "Quandl": parsedTicker, parsedExchange = TickerParserServer.find_quandl_market(index, ticker)
 
 			if forceMatch or parsedTicker is not None: ticker, exchange = parsedTicker, parsedExchange
 
 		return ticker, exchange
 
 	@staticmethod
-	def find_ccxt_crypto_market(ticker, exchange, platform, defaults):
+	def find_ccxt_crypto_market(index, ticker, exchange, platform, defaults):
 		if platform not in supported.cryptoExchanges or (exchange is not None and exchange.type != "crypto"): return ticker, exchange
-		exchanges = [TickerParserServer.exchanges[e] for e in supported.cryptoExchanges[platform] if TickerParserServer.exchanges[e].type == "crypto"] if exchange is None else [exchange]
-		if exchange is None and defaults["exchange"] is not None: exchanges.insert(0, TickerParserServer.exchanges[defaults["exchange"]])
+		exchanges = [index.exchanges[e] for e in supported.cryptoExchanges[platform] if index.exchanges[e].type == "crypto"] if exchange is None else [exchange]
+		if exchange is None and defaults["exchange"] is not None: exchanges.insert(0, index.exchanges[defaults["exchange"]])
 
 		for e in exchanges:
-			if e.properties is not None and e.properties.symbols is not None:
-				tokenizedStock = exchange is None and ticker.id in TickerParserServer.iexcStocksIndex and e.id in ["ftx", "bittrex"]
+			markets = index.markets.get(e.id)
+			if markets is not None:
+				tokenizedStock = exchange is None and ticker.id in index.iexcStocksIndex and e.id in ["ftx", "bittrex"]
 
-				if ticker.id in TickerParserServer.ccxtIndex[platform]:
-					for quote in TickerParserServer.ccxtIndex[platform][ticker.id]:
+				if ticker.id in index.ccxtIndex[platform]:
+					for quote in index.ccxtIndex[platform][ticker.id]:
 						symbol = "{}/{}".format(ticker.id, quote)
-						if symbol in e.properties.symbols and not tokenizedStock:
-							base = e.properties.markets[symbol]["base"]
-							quote = e.properties.markets[symbol]["quote"]
-							if not base in TickerParserServer.coingeckoFiatCurrencies and ("active" not in e.properties.markets[symbol] or e.properties.markets[symbol]["active"]): return Ticker(Ticker.generate_market_name(symbol, e), Ticker.generate_market_name(symbol, e), ticker.id, quote, symbol, hasParts=False, mcapRank=(TickerParserServer.coinGeckoIndex[ticker.id]["market_cap_rank"] if ticker.id in TickerParserServer.coinGeckoIndex else None)), e
+						if symbol in markets.markets and not tokenizedStock:
+							market = markets.markets[symbol]
+							base, quote = market.base, market.quote
+							if not base in index.coingeckoFiatCurrencies and market.active: return Ticker(market.name, market.name, ticker.id, quote, symbol, hasParts=False, mcapRank=(index.coinGeckoIndex[ticker.id]["market_cap_rank"] if ticker.id in index.coinGeckoIndex else None)), e
 
 				else:
-					currentBestMatch = sys.maxsize
-					currentBestFit = sys.maxsize
-					currentResult = None, exchange
-					for symbol in e.properties.symbols:
-						base = e.properties.markets[symbol]["base"]
-						quote = e.properties.markets[symbol]["quote"]
-						marketPair = symbol.split("/")
-						marketPairName = Ticker.generate_market_name(symbol, e)
-						mcapRank = TickerParserServer.coinGeckoIndex[base]["market_cap_rank"] if base in TickerParserServer.coinGeckoIndex else None
-						isReversed = False
-						if "active" not in e.properties.markets[symbol] or e.properties.markets[symbol]["active"]:
-							if len(marketPair) == 1:
-								for _ in range(2):
-									if (ticker.id == marketPair[0] or (marketPairName.startswith(ticker.id) and len(marketPairName) * 0.5 <= len(ticker.id))) and currentBestFit > 2:
-										currentBestFit = 2
-										currentResult = Ticker(marketPairName, marketPairName, base, quote, symbol, hasParts=False, mcapRank=mcapRank, isReversed=isReversed), e
-									if platform not in ["CoinGecko", "CCXT", "IEXC", "Quandl"]: break
-									marketPair.reverse()
-									base, quote, marketPairName, isReversed = quote, base, "".join(marketPair), True
-
-							elif marketPair[0] in TickerParserServer.ccxtIndex[platform] and marketPair[1] in TickerParserServer.ccxtIndex[platform][marketPair[0]]:
-								rankScore = TickerParserServer.ccxtIndex[platform][marketPair[0]].index(marketPair[1])
-								for _ in range(2):
-									if (ticker.id == marketPair[0] + marketPair[1] or (marketPairName.startswith(ticker.id) and len(marketPairName) * 0.5 <= len(ticker.id))) and currentBestFit >= 1 and base not in TickerParserServer.coingeckoFiatCurrencies and rankScore < currentBestMatch and not tokenizedStock:
-										currentBestMatch = rankScore
-										currentBestFit = 1
-										currentResult = Ticker(marketPairName, marketPairName, base, quote, symbol, hasParts=False, mcapRank=mcapRank, isReversed=isReversed), e
-										break
-									if platform not in ["CoinGecko", "CCXT", "IEXC", "Quandl"]: break
-									marketPair.reverse()
-									base, quote, marketPairName, isReversed = quote, base, "".join(marketPair), True
-
-					if currentResult[0] is not None: return currentResult
+					currentBestScore, currentBestMatch = None, None
+					candidates = index.ccxtMarketCandidates.get(e.id, [])
+					for position in index.ccxtMarketIndex.get(e.id, {}).get(ticker.id, []):
+						order, fit, isReversed, marketPairName, base, quote, symbol, pairBase, pairQuote, rankBase = candidates[position]
+						if isReversed and platform not in ["CoinGecko", "CCXT", "IEXC", "Quandl"]: continue
+						if fit == 1:
+							if base in index.coingeckoFiatCurrencies or tokenizedStock: continue
+							if pairBase not in index.ccxtIndex[platform] or pairQuote not in index.ccxtIndex[platform][pairBase]: continue
+							score = (1, index.ccxtIndex[platform][pairBase].index(pairQuote), order)
+						else:
+							score = (2, 0, order)
+
+						if currentBestScore is None or score < currentBestScore:
+							currentBestScore, currentBestMatch = score, (marketPairName, base, quote, symbol, isReversed, rankBase)
+
+					if currentBestScore is not None:
+						marketPairName, base, quote, symbol, isReversed, rankBase = currentBestMatch
+						mcapRank = index.coinGeckoIndex[rankBase]["market_cap_rank"] if rankBase in index.coinGeckoIndex else None
+						return Ticker(marketPairName, marketPairName, base, quote, symbol, hasParts=False, mcapRank=mcapRank, isReversed=isReversed), e
 
 		return None, exchange
 
 	@staticmethod
-	def find_coingecko_crypto_market(ticker):
+	def find_coingecko_crypto_market(index, ticker):
 		split = ticker.id.split(":")
 		if len(split) == 2:
 			tickerId, rank = split[0], "" if split[1] == "1" else ":{}".format(split[1])
@@ -535,106 +891,107 @@ class TickerParserServer(object):
 		else:
 			tickerId, rank = ticker.id, ""
 
-		if ticker.id in TickerParserServer.coinGeckoIndex:
-			return Ticker("{}USD".format(tickerId), "{}USD".format(tickerId), ticker.id, "USD", TickerParserServer.coinGeckoIndex[ticker.id]["id"], hasParts=False, mcapRank=TickerParserServer.coinGeckoIndex[ticker.id]["market_cap_rank"]), None
+		if ticker.id in index.coinGeckoIndex:
+			return Ticker("{}USD".format(tickerId), "{}USD".format(tickerId), ticker.id, "USD", index.coinGeckoIndex[ticker.id]["id"], hasParts=False, mcapRank=index.coinGeckoIndex[ticker.id]["market_cap_rank"]), None
 
 		else:
-			for base in TickerParserServer.coinGeckoIndex:
-				if ticker.id.startswith(base):
-					for quote in TickerParserServer.coingeckoVsCurrencies:
-						if tickerId == "{}{}".format(base, quote) and base + rank in TickerParserServer.coinGeckoIndex:
-							return Ticker(tickerId, tickerId, base + rank, quote, TickerParserServer.coinGeckoIndex[base + rank]["id"], hasParts=False, mcapRank=TickerParserServer.coinGeckoIndex[base + rank]["market_cap_rank"]), None
-
-			for base in TickerParserServer.coinGeckoIndex:
-				if base.startswith(tickerId) and base + rank in TickerParserServer.coinGeckoIndex:
-					return Ticker("{}USD".format(base), "{}USD".format(base), base + rank, "USD", TickerParserServer.coinGeckoIndex[base + rank]["id"], hasParts=False, mcapRank=TickerParserServer.coinGeckoIndex[base + rank]["market_cap_rank"]), None
-
-			for base in TickerParserServer.coinGeckoIndex:
-				if tickerId.endswith(base) and base + rank in TickerParserServer.coinGeckoIndex:
-					for quote in TickerParserServer.coingeckoVsCurrencies:
-						if tickerId == "{}{}".format(quote, base):
-							return Ticker(tickerId, tickerId, quote, base + rank, TickerParserServer.coinGeckoIndex[base + rank]["id"], hasParts=False, mcapRank=TickerParserServer.coinGeckoIndex[base + rank]["market_cap_rank"], isReversed=True), None
+			# Bases are ranked by their position in the index, the first matching base wins in each of the three passes
+			positions = index.coinGeckoPositions
+
+			matches = []
+			for length in range(len(ticker.id) + 1):
+				base, quote = ticker.id[:length], tickerId[length:]
+				if base in positions and tickerId.startswith(base) and quote in index.coingeckoVsCurrencies and base + rank in index.coinGeckoIndex: matches.append(base)
+			if len(matches) != 0:
+				base = min(matches, key=lambda base: positions[base])
+				quote = tickerId[len(base):]
+				return Ticker(tickerId, tickerId, base + rank, quote, index.coinGeckoIndex[base + rank]["id"], hasParts=False, mcapRank=index.coinGeckoIndex[base + rank]["market_cap_rank"]), None
+
+			if rank == "":
+				base = index.coinGeckoPrefixIndex.get(tickerId)
+			else:
+				matches = []
+				for base in index.coinGeckoSortedIndex[bisect_left(index.coinGeckoSortedIndex, tickerId):]:
+					if not base.startswith(tickerId): break
+					if base + rank in index.coinGeckoIndex: matches.append(base)
+				base = min(matches, key=lambda base: positions[base]) if len(matches) != 0 else None
+			if base is not None:
+				return Ticker("{}USD".format(base), "{}USD".format(base), base + rank, "USD", index.coinGeckoIndex[base + rank]["id"], hasParts=False, mcapRank=index.coinGeckoIndex[base + rank]["market_cap_rank"]), None
+
+			matches = []
+			for length in range(len(tickerId) + 1):
+				quote, base = tickerId[:length], tickerId[length:]
+				if base in positions and quote in index.coingeckoVsCurrencies and base + rank in index.coinGeckoIndex: matches.append(base)
+			if len(matches) != 0:
+				base = min(matches, key=lambda base: positions[base])
+				quote = tickerId[:len(tickerId) - len(base)]
+				return Ticker(tickerId, tickerId, quote, base + rank, index.coinGeckoIndex[base + rank]["id"], hasParts=False, mcapRank=index.coinGeckoIndex[base + rank]["market_cap_rank"], isReversed=True), None
 
 		return None, None
 
 	@staticmethod
-	def find_iexc_market(ticker, exchange):
-		if ticker.id in TickerParserServer.iexcForexIndex and exchange is None:
-			return Ticker(TickerParserServer.iexcForexIndex[ticker.id]["id"], TickerParserServer.iexcForexIndex[ticker.id]["name"], TickerParserServer.iexcForexIndex[ticker.id]["base"], TickerParserServer.iexcForexIndex[ticker.id]["quote"], "{}/{}".format(TickerParserServer.iexcForexIndex[ticker.id]["base"], TickerParserServer.iexcForexIndex[ticker.id]["quote"]), hasParts=False, isReversed=TickerParserServer.iexcForexIndex[ticker.id]["reversed"]), None
-		elif ticker.id in TickerParserServer.iexcStocksIndex and (exchange is None or ticker.id in exchange.properties.symbols):
+	def find_iexc_market(index, ticker, exchange):
+		if ticker.id in index.iexcForexIndex and exchange is None:
+			return Ticker(index.iexcForexIndex[ticker.id]["id"], index.iexcForexIndex[ticker.id]["name"], index.iexcForexIndex[ticker.id]["base"], index.iexcForexIndex[ticker.id]["quote"], "{}/{}".format(index.iexcForexIndex[ticker.id]["base"], index.iexcForexIndex[ticker.id]["quote"]), hasParts=False, isReversed=index.iexcForexIndex[ticker.id]["reversed"]), None
+		elif ticker.id in index.iexcStocksIndex and (exchange is None or ticker.id in exchange.properties.symbols):
 			if exchange is None:
-				exchange = TickerParserServer.exchanges[TickerParserServer.iexcStocksIndex[ticker.id]["exchange"]]
-			return Ticker(ticker.id, TickerParserServer.iexcStocksIndex[ticker.id]["name"], ticker.id, TickerParserServer.iexcStocksIndex[ticker.id]["quote"], "{}/{}".format(ticker.id, TickerParserServer.iexcStocksIndex[ticker.id]["quote"]), hasParts=False), exchange
-		elif ticker.id.endswith("USD") and ticker.id[:-3] in TickerParserServer.iexcStocksIndex and (exchange is None or ticker.id[:-3] in exchange.properties.symbols):
+				exchange = index.exchanges[index.iexcStocksIndex[ticker.id]["exchange"]]
+			return Ticker(ticker.id, index.iexcStocksIndex[ticker.id]["name"], ticker.id, index.iexcStocksIndex[ticker.id]["quote"], "{}/{}".format(ticker.id, index.iexcStocksIndex[ticker.id]["quote"]), hasParts=False), exchange
+		elif ticker.id.endswith("USD") and ticker.id[:-3] in index.iexcStocksIndex and (exchange is None or ticker.id[:-3] in exchange.properties.symbols):
 			ticker.id = ticker.id[:-3]
 			if exchange is None:
-				exchange = TickerParserServer.exchanges[TickerParserServer.iexcStocksIndex[ticker.id]["exchange"]]
-			return Ticker(ticker.id, TickerParserServer.iexcStocksIndex[ticker.id]["name"], ticker.id, TickerParserServer.iexcStocksIndex[ticker.id]["quote"], "{}/{}".format(ticker.id, TickerParserServer.iexcStocksIndex[ticker.id]["quote"]), hasParts=False), exchange
-		elif ticker.id.startswith("USD") and ticker.id[3:] in TickerParserServer.iexcStocksIndex and (exchange is None or ticker.id[:-3] in exchange.properties.symbols):
+				exchange = index.exchanges[index.iexcStocksIndex[ticker.id]["exchange"]]
+			return Ticker(ticker.id, index.iexcStocksIndex[ticker.id]["name"], ticker.id, index.iexcStocksIndex[ticker.id]["quote"], "{}/{}".format(ticker.id, index.iexcStocksIndex[ticker.id]["quote"]), hasParts=False), exchange
+		elif ticker.id.startswith("USD") and ticker.id[3:] in index.iexcStocksIndex and (exchange is None or ticker.id[:-3] in exchange.properties.symbols):
 			ticker.id = ticker.id[3:]
 			if exchange is None:
-				exchange = TickerParserServer.exchanges[TickerParserServer.iexcStocksIndex[ticker.id]["exchange"]]
-			return Ticker(ticker.id, TickerParserServer.iexcStocksIndex[ticker.id]["name"], ticker.id, TickerParserServer.iexcStocksIndex[ticker.id]["quote"], "{}/{}".format(ticker.id, TickerParserServer.iexcStocksIndex[ticker.id]["quote"]), hasParts=False, isReversed=True), exchange
+				exchange = index.exchanges[index.iexcStocksIndex[ticker.id]["exchange"]]
+			return Ticker(ticker.id, index.iexcStocksIndex[ticker.id]["name"], ticker.id, index.iexcStocksIndex[ticker.id]["quote"], "{}/{}".format(ticker.id, index.iexcStocksIndex[ticker.id]["quote"]), hasParts=False, isReversed=True), exchange
 
 		return None, None
 
 	@staticmethod
-	def find_quandl_market(ticker):
+	def find_quandl_market(index, ticker):
 		return None, None
 
 	@staticmethod
-	def get_coingecko_image(base):
-		if base in TickerParserServer.coinGeckoIndex:
-			response = TickerParserServer.coinGeckoIndex[base].get("image", "")
+	def get_coingecko_image(index, base):
+		if base in index.coinGeckoIndex:
+			response = index.coinGeckoIndex[base].get("image", "")
 			if response.startswith("https://"): return response
 		return static_storage.icon
 
 	@staticmethod
-	def check_if_fiat(tickerId):
-		for fiat in TickerParserServer.coingeckoFiatCurrencies:
+	def check_if_fiat(index, tickerId):
+		for fiat in index.coingeckoFiatCurrencies:
 			if fiat.upper() in tickerId: return True, fiat.upper()
 		return False, tickerId
 
 	@staticmethod
-	def get_listings(ticker):
-		listings = {ticker.quote: []}
-		total = 0
-		for id in supported.cryptoExchanges["CCXT"]:
-			if TickerParserServer.exchanges[id].properties is not None and TickerParserServer.exchanges[id].properties.symbols is not None:
-				for symbol in TickerParserServer.exchanges[id].properties.symbols:
-					base = TickerParserServer.exchanges[id].properties.markets[symbol]["base"]
-					quote = TickerParserServer.exchanges[id].properties.markets[symbol]["quote"]
-					if ticker.base == base:
-						if quote not in listings: listings[quote] = []
-						if TickerParserServer.exchanges[id].name not in listings[quote]:
-							listings[quote].append(TickerParserServer.exchanges[id].name)
-							total += 1
-
-		response = [(ticker.quote, listings.pop(ticker.quote))]
-		if ticker.base in TickerParserServer.ccxtIndex["CCXT"]:
-			for quote in TickerParserServer.ccxtIndex["CCXT"][ticker.base]:
-				if quote in listings:
-					response.append((quote, listings.pop(quote)))
-
-		return response, total
+	def get_listings(index, ticker):
+		listings = index.listingsIndex.get(ticker.base)
+		if listings is None: return [(ticker.quote, [])], 0
+
+		response = [(ticker.quote, listings["quotes"].get(ticker.quote, []))]
+		for quote in listings["ranked"]:
+			if quote != ticker.quote:
+				response.append((quote, listings["quotes"][quote]))
+
+		return response, listings["total"]
 
 	@staticmethod
-	def format_price(exchangeId, symbol, price):
-		exchange = TickerParserServer.exchanges[exchangeId].properties
-		precision = exchange.markets.get(symbol, {}).get("precision", {}).get("price", 8)
-		price = float(dtp.decimal_to_precision(price, rounding_mode=dtp.ROUND, precision=precision, counting_mode=exchange.precisionMode, padding_mode=dtp.PAD_WITH_ZERO))
-		return ("{:,.%df}" % Utils.num_of_decimal_places(exchange, price, precision)).format(price)
+	def format_price(index, exchangeId, symbol, price):
+		return PrecisionTable(index.precisionTable).format_price(exchangeId, symbol, price)
 
 	@staticmethod
-	def format_amount(exchangeId, symbol, amount):
-		exchange = TickerParserServer.exchanges[exchangeId].properties
-		precision = exchange.markets.get(symbol, {}).get("precision", {}).get("amount", 8)
-		amount = float(dtp.decimal_to_precision(amount, rounding_mode=dtp.TRUNCATE, precision=precision, counting_mode=exchange.precisionMode, padding_mode=dtp.NO_PADDING))
-		return ("{:,.%df}" % Utils.num_of_decimal_places(exchange, amount, precision)).format(amount)
+	def format_amount(index, exchangeId, symbol, amount):
+		return PrecisionTable(index.precisionTable).format_amount(exchangeId, symbol, amount)
 
 
 if __name__ == "__main__":
 	os.environ["PRODUCTION_MODE"] = os.environ["PRODUCTION_MODE"] if "PRODUCTION_MODE" in os.environ and os.environ["PRODUCTION_MODE"] else ""
 	print("[Startup]: Ticker Parser Server is in startup, running in {} mode.".format("production" if os.environ["PRODUCTION_MODE"] else "development"))
-	tickerParser = TickerParserServer()
-	tickerParser.run()
\ No newline at end of file
+	workerCount = int(os.environ.get("PARSER_WORKERS", 1))
+	tickerParser = TickerParserServer(workerCount)
+	if workerCount > 1: tickerParser.queue()
+	else: tickerParser.run()
\ No newline at end of file
@@ -0,0 +1,35 @@
+from threading import Lock, Event
+
+
+class SingleflightCall(object):
+	def __init__(self):
+		self.event = Event()
+		self.result = None
+		self.exception = None
+
+
+class Singleflight(object):
+	def __init__(self):
+		self.calls = {}
+		self.lock = Lock()
+
+	def run(self, key, function, *args):
+		with self.lock:
+			call = self.calls.get(key)
+			isLeader = call is None
+			if isLeader: call = self.calls[key] = SingleflightCall()
+
+		if not isLeader:
+			call.event.wait()
+			if call.exception is not None: raise call.exception
+			return call.result
+
+		try:
+			call.result = function(*args)
+			return call.result
+		except Exception as e:
+			call.exception = e
+			raise
+		finally:
+			with self.lock: self.calls.pop(key, None)
+			call.event.set()
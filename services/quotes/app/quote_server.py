@@ -7,10 +7,10 @@ import zlib
 import pickle
 import requests
 from io import BytesIO
-import base64
 import datetime
 import pytz
 import traceback
+from threading import Thread, Lock
 
 import ccxt
 from pycoingecko import CoinGeckoAPI
@@ -23,10 +23,13 @@ from matplotlib import ticker as tkr
 import matplotlib.transforms as mtransforms
 from google.cloud import firestore, storage, error_reporting
 
-from TickerParser import TickerParser, Ticker, Exchange, supported
+from Cache import Cache, SharedCache
+from DatabaseConnector import StatisticsWriter
+from TickerParser import TickerParser, Ticker, ExchangeRegistry, supported
 
 from assets import static_storage
 from helpers.utils import Utils
+from helpers.singleflight import Singleflight
 from helpers import constants
 
 
@@ -41,6 +44,8 @@ plt.rcParams['figure.figsize'] = (8, 6)
 plt.rcParams["figure.dpi"] = 200.0
 plt.rcParams['savefig.facecolor'] = "#131722"
 
+LRU_READY = b"\x01"
+
 
 class QuoteProcessor(object):
 	imageOverlays = {
@@ -50,6 +55,22 @@ class QuoteProcessor(object):
 	stableCoinTickers = ["USD", "USDT", "USDC", "DAI", "HUSD", "TUSD", "PAX", "USDK", "USDN", "BUSD", "GUSD", "USDS"]
 	lastBitcoinQuote = {}
 
+	cacheTtl = {
+		"Alternative.me": 600,
+		"LLD": {
+			"funding": 60,
+			"oi": 30,
+			"ls": 60,
+			"sl": 60,
+			"dom": 120
+		},
+		"CoinGecko": 10,
+		"CCXT": 5,
+		"IEXC": 10
+	}
+	cacheSize = 4 * 1024 * 1024
+	negativeCacheTtl = 15
+
 	def __init__(self):
 		self.isServiceAvailable = True
 		signal.signal(signal.SIGINT, self.exit_gracefully)
@@ -58,6 +79,8 @@ class QuoteProcessor(object):
 		self.logging = error_reporting.Client(service="quote_server")
 
 		self.coinGecko = CoinGeckoAPI()
+		self.statistics = StatisticsWriter(database)
+		self.exchanges = ExchangeRegistry(clientsPerExchange=int(os.environ.get("QUOTE_SERVER_WORKERS", 4)))
 		self.lastBitcoinQuote = {
 			"quotePrice": [0],
 			"quoteVolume": None,
@@ -72,22 +95,77 @@ class QuoteProcessor(object):
 			self.lastBitcoinQuote["quoteVolume"] = rawData["market_data"]["total_volume"]["usd"]
 		except: pass
 
-		context = zmq.Context.instance()
-		self.socket = context.socket(zmq.ROUTER)
-		self.socket.bind("tcp://*:6900")
+		self.plotLock = Lock()
+		self.inflightQuotes = Singleflight()
+		self.cache = {}
+		for platform, ttl in QuoteProcessor.cacheTtl.items():
+			if isinstance(ttl, dict): self.cache[platform] = {action: Cache(ttl=actionTtl, maxSize=QuoteProcessor.cacheSize, negativeTtl=QuoteProcessor.negativeCacheTtl, shared=SharedCache.from_environment("quotes/{}/{}".format(platform, action))) for action, actionTtl in ttl.items()}
+			else: self.cache[platform] = Cache(ttl=ttl, maxSize=QuoteProcessor.cacheSize, negativeTtl=QuoteProcessor.negativeCacheTtl, shared=SharedCache.from_environment("quotes/{}".format(platform)))
+		self.workerStatistics = {}
 
-		print("[Startup]: Quote Server is online")
-
-	def exit_gracefully(self):
+	def exit_gracefully(self, signum, frame):
 		print("[Startup]: Quote Server is exiting")
-		self.socket.close()
 		self.isServiceAvailable = False
 
-	def run(self):
+	def queue(self):
+		context = zmq.Context.instance()
+		frontend = context.socket(zmq.ROUTER)
+		frontend.bind("tcp://*:6900")
+		backend = context.socket(zmq.ROUTER)
+		backend.bind("inproc://quote-workers")
+
+		workerPoller = zmq.Poller()
+		workerPoller.register(backend, zmq.POLLIN)
+		poller = zmq.Poller()
+		poller.register(backend, zmq.POLLIN)
+		poller.register(frontend, zmq.POLLIN)
+
+		# Requests are only handed to idle workers, so a slow request never holds up the ones queued after it
+		availableWorkers = []
+		while self.isServiceAvailable:
+			try:
+				sockets = dict((poller if len(availableWorkers) != 0 else workerPoller).poll(1000))
+
+				if backend in sockets:
+					workerId, *response = backend.recv_multipart()
+					availableWorkers.append(workerId)
+					if response != [LRU_READY]: frontend.send_multipart(response, copy=False)
+
+				if frontend in sockets and len(availableWorkers) != 0:
+					message = frontend.recv_multipart()
+					backend.send_multipart([availableWorkers.pop(0)] + message)
+
+			except (KeyboardInterrupt, SystemExit): break
+			except Exception:
+				print(traceback.format_exc())
+				if os.environ["PRODUCTION_MODE"]: self.logging.report_exception()
+
+		frontend.close()
+		backend.close()
+
+	def report_statistics(self, interval=300):
+		lastReport = {identity: dict(statistics) for identity, statistics in self.workerStatistics.items()}
+		while self.isServiceAvailable:
+			time.sleep(interval)
+			for identity, statistics in sorted(self.workerStatistics.items()):
+				current = dict(statistics)
+				previous = lastReport.get(identity, {"requests": 0, "busy": 0})
+				if current["since"] is not None: current["busy"] += time.time() - current["since"]
+				print("[Statistics]: Worker {} handled {} requests, busy {:.1f} % of the time".format(identity, current["requests"] - previous["requests"], (current["busy"] - previous["busy"]) / interval * 100))
+				lastReport[identity] = current
+
+	def run(self, identity):
+		socket = zmq.Context.instance().socket(zmq.DEALER)
+		socket.identity = identity.encode("ascii")
+		socket.connect("inproc://quote-workers")
+		statistics = self.workerStatistics[identity] = {"requests": 0, "busy": 0, "since": None}
+		socket.send(LRU_READY)
+
 		while self.isServiceAvailable:
 			try:
 				response = None, None
-				origin, delimeter, clientId, service, request = self.socket.recv_multipart()
+				origin, delimeter, clientId, service, request = socket.recv_multipart()
+				statistics["since"] = time.time()
 				request = pickle.loads(zlib.decompress(request))
 				if request.timestamp + 60 < time.time(): continue
 
@@ -101,8 +179,17 @@ class QuoteProcessor(object):
 				print(traceback.format_exc())
 				if os.environ["PRODUCTION_MODE"]: self.logging.report_exception()
 			finally:
-				try: self.socket.send_multipart([origin, delimeter, zlib.compress(pickle.dumps(response, -1))])
+				try:
+					payload, responseText = response
+					if isinstance(payload, bytes): socket.send_multipart([origin, delimeter, zlib.compress(pickle.dumps((None, responseText), -1)), payload], copy=False)
+					else: socket.send_multipart([origin, delimeter, zlib.compress(pickle.dumps(response, -1))])
 				except: pass
+				if statistics["since"] is not None:
+					statistics["requests"] += 1
+					statistics["busy"] += time.time() - statistics["since"]
+					statistics["since"] = None
+
+		socket.close()
 
 	def request_depth(self, request):
 		payload, quoteMessage, updatedQuoteMessage = None, None, None
@@ -117,7 +204,7 @@ class QuoteProcessor(object):
 
 			if payload is not None:
 				if request.authorId != 401328409499664394 and request.requests[platform].ticker.base is not None and request.authorId not in constants.satellites:
-					database.document("dataserver/statistics/{}/{}".format(platform, str(uuid.uuid4()))).set({
+					self.statistics.write("dataserver/statistics/{}/{}".format(platform, str(uuid.uuid4())), {
 						"timestamp": time.time(),
 						"authorId": str(request.authorId),
 						"ticker": {
@@ -139,23 +226,25 @@ class QuoteProcessor(object):
 
 		for platform in request.platforms:
 			request.set_current(platform=platform)
-
-			if platform == "Alternative.me":
-				payload, updatedQuoteMessage = self.request_fear_greed_index(request)
-			elif platform == "LLD":
-				payload, updatedQuoteMessage = self.request_lld_quote(request)
-			elif platform == "CoinGecko":
-				payload, updatedQuoteMessage = self.request_coingecko_quote(request)
-			elif platform == "CCXT":
-				payload, updatedQuoteMessage = self.request_ccxt_quote(request)
-			elif platform == "IEXC":
-				payload, updatedQuoteMessage = self.request_iexc_quote(request)
-			elif platform == "Quandl":
-				pass
+			hashCode = request.requests[platform].fingerprint()
+			cache = self.get_cache_for(platform, request) if request.can_cache() else None
+			cachedPayload = None if cache is None else cache.get(hashCode)
+			negativeResponse = None if cache is None or cachedPayload is not None else cache.get_negative(hashCode)
+
+			if cachedPayload is not None:
+				payload = {**cachedPayload, "raw": {**cachedPayload["raw"], "timestamp": time.time()}}
+				updatedQuoteMessage = None
+			elif negativeResponse is not None:
+				payload, updatedQuoteMessage = negativeResponse
+			else:
+				payload, updatedQuoteMessage = self.inflightQuotes.run(hashCode, self.request_platform_quote, platform, request)
+				if cache is not None:
+					if payload is not None: cache.set(hashCode, payload)
+					else: cache.set_negative(hashCode, (None, updatedQuoteMessage))
 
 			if payload is not None:
 				if request.authorId != 401328409499664394 and request.requests[platform].ticker.base is not None and request.authorId not in constants.satellites:
-					database.document("dataserver/statistics/{}/{}".format(platform, str(uuid.uuid4()))).set({
+					self.statistics.write("dataserver/statistics/{}/{}".format(platform, str(uuid.uuid4())), {
 						"timestamp": time.time(),
 						"authorId": str(request.authorId),
 						"ticker": {
@@ -172,6 +261,24 @@ class QuoteProcessor(object):
 
 		return None, quoteMessage
 
+	def get_cache_for(self, platform, request):
+		cache = self.cache.get(platform)
+		if isinstance(cache, dict): return cache.get(request.find_parameter_in_list("lld", request.get_filters()))
+		return cache
+
+	def request_platform_quote(self, platform, request):
+		if platform == "Alternative.me":
+			return self.request_fear_greed_index(request)
+		elif platform == "LLD":
+			return self.request_lld_quote(request)
+		elif platform == "CoinGecko":
+			return self.request_coingecko_quote(request)
+		elif platform == "CCXT":
+			return self.request_ccxt_quote(request)
+		elif platform == "IEXC":
+			return self.request_iexc_quote(request)
+		return None, None
+
 	def request_coingecko_quote(self, request):
 		ticker = request.get_ticker()
 		exchange = request.get_exchange()
@@ -226,11 +333,11 @@ class QuoteProcessor(object):
 
 		try:
 			if exchange is None: return None, None
-			exchange = Exchange(exchange.id, "crypto")
+			exchange = self.exchanges.get(exchange.id)
 
 			tf, limitTimestamp, candleOffset = Utils.get_highest_supported_timeframe(exchange.properties, datetime.datetime.now().astimezone(pytz.utc))
 			try:
-				rawData = exchange.properties.fetch_ohlcv(ticker.symbol, timeframe=tf.lower(), since=limitTimestamp, limit=300)
+				with self.exchanges.checkout(exchange) as client: rawData = client.fetch_ohlcv(ticker.symbol, timeframe=tf.lower(), since=limitTimestamp, limit=300)
 				if len(rawData) == 0 or rawData[-1][4] is None or rawData[0][1] is None: return None, None
 			except:
 				return None, None
@@ -255,7 +362,7 @@ class QuoteProcessor(object):
 					"quotePrice": [price[0]] if tf == "1m" else price[:1],
 					"quoteVolume": volume,
 					"ticker": ticker,
-					"exchange": exchange,
+					"exchange": request.get_exchange(),
 					"timestamp": time.time()
 				}
 			}
@@ -276,11 +383,12 @@ class QuoteProcessor(object):
 		action = request.find_parameter_in_list("lld", filters)
 
 		try:
-			if exchange is not None: exchange = Exchange(exchange.id, "crypto")
+			if exchange is not None: exchange = self.exchanges.get(exchange.id)
 
 			if action == "funding":
 				if exchange.id in ["bitmex"]:
-					try: rawData = exchange.properties.public_get_instrument({"symbol": ticker.id})[0]
+					try:
+						with self.exchanges.checkout(exchange) as client: rawData = client.public_get_instrument({"symbol": ticker.id})[0]
 					except: return None, "Requested funding data for `{}` is not available.".format(ticker.name)
 
 					if rawData["fundingTimestamp"] is not None:
@@ -320,7 +428,7 @@ class QuoteProcessor(object):
 						"raw": {
 							"quotePrice": [fundingRate, predictedFundingRate],
 							"ticker": ticker,
-							"exchange": exchange,
+							"exchange": request.get_exchange(),
 							"timestamp": time.time()
 						}
 					}
@@ -328,7 +436,8 @@ class QuoteProcessor(object):
 				return None, "Funding data is only available on BitMEX."
 			elif action == "oi":
 				if exchange.id in ["bitmex"]:
-					try: rawData = exchange.properties.public_get_instrument({"symbol": ticker.id})[0]
+					try:
+						with self.exchanges.checkout(exchange) as client: rawData = client.public_get_instrument({"symbol": ticker.id})[0]
 					except: return None, "Requested open interest data for `{}` is not available.".format(ticker.name)
 
 					payload = {
@@ -343,7 +452,7 @@ class QuoteProcessor(object):
 						"raw": {
 							"quotePrice": [float(rawData["openInterest"]), float(rawData["openValue"]) / 100000000],
 							"ticker": ticker,
-							"exchange": exchange,
+							"exchange": request.get_exchange(),
 							"timestamp": time.time()
 						}
 					}
@@ -352,8 +461,9 @@ class QuoteProcessor(object):
 			elif action == "ls":
 				if exchange.id in ["bitfinex2"]:
 					try:
-						longs = exchange.properties.publicGetStats1KeySizeSymbolLongLast({"key": "pos.size", "size": "1m", "symbol": "t{}".format(ticker.id), "side": "long", "section": "last"})
-						shorts = exchange.properties.publicGetStats1KeySizeSymbolShortLast({"key": "pos.size", "size": "1m", "symbol": "t{}".format(ticker.id), "side": "long", "section": "last"})
+						with self.exchanges.checkout(exchange) as client:
+							longs = client.publicGetStats1KeySizeSymbolLongLast({"key": "pos.size", "size": "1m", "symbol": "t{}".format(ticker.id), "side": "long", "section": "last"})
+							shorts = client.publicGetStats1KeySizeSymbolShortLast({"key": "pos.size", "size": "1m", "symbol": "t{}".format(ticker.id), "side": "long", "section": "last"})
 						ratio = longs[1] / (longs[1] + shorts[1]) * 100
 					except:
 						return None, None
@@ -370,7 +480,7 @@ class QuoteProcessor(object):
 						"raw": {
 							"quotePrice": [longs[1], shorts[1]],
 							"ticker": ticker,
-							"exchange": exchange,
+							"exchange": request.get_exchange(),
 							"timestamp": time.time()
 						}
 					}
@@ -379,8 +489,9 @@ class QuoteProcessor(object):
 			elif action == "sl":
 				if exchange.id in ["bitfinex2"]:
 					try:
-						longs = exchange.properties.publicGetStats1KeySizeSymbolLongLast({"key": "pos.size", "size": "1m", "symbol": "t{}".format(ticker.id), "side": "short", "section": "last"})
-						shorts = exchange.properties.publicGetStats1KeySizeSymbolShortLast({"key": "pos.size", "size": "1m", "symbol": "t{}".format(ticker.id), "side": "short", "section": "last"})
+						with self.exchanges.checkout(exchange) as client:
+							longs = client.publicGetStats1KeySizeSymbolLongLast({"key": "pos.size", "size": "1m", "symbol": "t{}".format(ticker.id), "side": "short", "section": "last"})
+							shorts = client.publicGetStats1KeySizeSymbolShortLast({"key": "pos.size", "size": "1m", "symbol": "t{}".format(ticker.id), "side": "short", "section": "last"})
 						ratio = shorts[1] / (longs[1] + shorts[1]) * 100
 					except:
 						return None, None
@@ -397,7 +508,7 @@ class QuoteProcessor(object):
 						"raw": {
 							"quotePrice": [longs[1], shorts[1]],
 							"ticker": ticker,
-							"exchange": exchange,
+							"exchange": request.get_exchange(),
 							"timestamp": time.time()
 						}
 					}
@@ -569,19 +680,19 @@ class QuoteProcessor(object):
 
 		try:
 			if exchange is None: return None, None
-			exchange = Exchange(exchange.id, "crypto")
+			exchange = self.exchanges.get(exchange.id)
 
 			try:
-				depthData = exchange.properties.fetch_order_book(ticker.symbol)
+				with self.exchanges.checkout(exchange) as client: depthData = client.fetch_order_book(ticker.symbol)
 				bestBid = depthData["bids"][0]
 				bestAsk = depthData["asks"][0]
 				lastPrice = (bestBid[0] + bestAsk[0]) / 2
 			except:
 				return None, None
 
-			imageData = self.generate_depth_image(depthData, bestBid, bestAsk, lastPrice)
+			with self.plotLock: imageData = self.generate_depth_image(depthData, bestBid, bestAsk, lastPrice)
 			if uploadMode:
-				bucket.blob("uploads/{}.png".format(int(time.time() * 1000))).upload_from_string(base64.decodebytes(imageData))
+				bucket.blob("uploads/{}.png".format(int(time.time() * 1000))).upload_from_string(imageData)
 
 			return imageData, None
 		except Exception:
@@ -610,9 +721,9 @@ class QuoteProcessor(object):
 			except:
 				return None, None
 
-			imageData = self.generate_depth_image(depthData, bestBid, bestAsk, lastPrice)
+			with self.plotLock: imageData = self.generate_depth_image(depthData, bestBid, bestAsk, lastPrice)
 			if uploadMode:
-				bucket.blob("uploads/{}.png".format(int(time.time() * 1000))).upload_from_string(base64.decodebytes(imageData))
+				bucket.blob("uploads/{}.png".format(int(time.time() * 1000))).upload_from_string(imageData)
 
 			return imageData, None
 		except Exception:
@@ -696,7 +807,7 @@ class QuoteProcessor(object):
 		chartImage.paste(Image.open(rawImageData))
 		chartImage = Image.alpha_composite(chartImage, self.imageOverlays["Alpha depth"])
 		chartImage.save(imageBuffer, format="png")
-		imageData = base64.b64encode(imageBuffer.getvalue())
+		imageData = imageBuffer.getvalue()
 		imageBuffer.close()
 
 		return imageData
@@ -706,4 +817,13 @@ if __name__ == "__main__":
 	os.environ["PRODUCTION_MODE"] = os.environ["PRODUCTION_MODE"] if "PRODUCTION_MODE" in os.environ and os.environ["PRODUCTION_MODE"] else ""
 	print("[Startup]: Quote Server is in startup, running in {} mode.".format("production" if os.environ["PRODUCTION_MODE"] else "development"))
 	quoteServer = QuoteProcessor()
-	quoteServer.run()
\ No newline at end of file
+
+	processingThreads = []
+	for i in range(int(os.environ.get("QUOTE_SERVER_WORKERS", 4))):
+		p = Thread(target=quoteServer.run, args=(str(i),), daemon=True)
+		p.start()
+		processingThreads.append(p)
+	Thread(target=quoteServer.report_statistics, daemon=True).start()
+
+	print("[Startup]: Quote Server is online")
+	quoteServer.queue()
\ No newline at end of file